@@ -8,11 +8,13 @@ Provides HTTPX-based client with resilience patterns including:
 - Metrics collection
 """
 
-from tests.api.client import PokeAPIClient
+from tests.api.client import PokeAPIClient, get_shared_client, close_shared_client
 from tests.api.endpoints import POKEMON_ENDPOINT, TYPE_ENDPOINT, ABILITY_ENDPOINT
 
 __all__ = [
     'PokeAPIClient',
+    'get_shared_client',
+    'close_shared_client',
     'POKEMON_ENDPOINT',
     'TYPE_ENDPOINT',
     'ABILITY_ENDPOINT',
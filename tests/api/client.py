@@ -13,23 +13,65 @@ Provides async HTTP client with:
 import asyncio
 import random
 import logging
-from typing import Dict, Any, Optional
+from functools import cached_property
+from time import perf_counter
+from typing import Dict, Any, Optional, Callable, Awaitable, Iterable, List
 import httpx
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    before_sleep_log,
-)
+import orjson
 
 from tests.api.endpoints import get_pokemon_url, get_type_url, get_ability_url
+from tests.api.transport import create_transport
+from tests.models.pokemon import Pokemon, parse_pokemon
+from tests.models.type import Type, parse_type
+from tests.models.ability import Ability, parse_ability
 from tests.utils.rate_limiter import RateLimiter
-from tests.utils.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+from tests.utils.circuit_breaker import CircuitBreaker
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Connection pool limits for the shared HTTPX client
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=300,
+)
+
+# Process-wide HTTPX client reused by every PokeAPIClient that is not
+# given its own, so keep-alive connections survive across tests
+_SHARED_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client(timeout: float = 10.0) -> httpx.AsyncClient:
+    """
+    Get the shared HTTPX async client, creating it on first use.
+    
+    Args:
+        timeout: Default request timeout in seconds (only applied on creation;
+            PokeAPIClient passes its own timeout on every request)
+        
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _SHARED_CLIENT
+    
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        _SHARED_CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout),
+            follow_redirects=True,
+            transport=create_transport(DEFAULT_LIMITS, http2=True),
+        )
+    return _SHARED_CLIENT
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTPX client if it was created."""
+    global _SHARED_CLIENT
+    
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
+
 
 class PokeAPIClient:
     """
@@ -46,6 +88,9 @@ class PokeAPIClient:
     - Metrics collection integration
     """
     
+    # Position of each endpoint's circuit breaker in self._cbs
+    _CB_INDEX: Dict[str, int] = {'pokemon': 0, 'type': 1, 'ability': 2}
+    
     def __init__(
         self,
         base_url: str = "https://pokeapi.co/api/v2",
@@ -53,6 +98,9 @@ class PokeAPIClient:
         rate_limiter: Optional[RateLimiter] = None,
         metrics_collector: Optional[Any] = None,
         max_retries: int = 3,
+        client: Optional[httpx.AsyncClient] = None,
+        owns_client: bool = False,
+        max_backoff: float = 30.0,
     ):
         """
         Initialize the PokéAPI client.
@@ -63,29 +111,58 @@ class PokeAPIClient:
             rate_limiter: Optional RateLimiter instance
             metrics_collector: Optional MetricsCollector instance
             max_retries: Maximum number of retry attempts
+            client: Optional httpx.AsyncClient to use (defaults to the shared client)
+            owns_client: Whether close() should close the underlying client
+            max_backoff: Upper bound in seconds for any retry delay
         """
         self.base_url = base_url
         self.timeout = timeout
+        # Passed on every request, since the shared client may have been
+        # created with another instance's timeout
+        self._request_timeout = httpx.Timeout(timeout)
         self.max_retries = max_retries
+        self.max_backoff = max_backoff
         self.rate_limiter = rate_limiter
         self.metrics_collector = metrics_collector
         
-        # Create HTTPX async client
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(timeout),
-            follow_redirects=True,
-        )
+        # Reuse the shared HTTPX client unless one is injected
+        if client is None:
+            client = get_shared_client(timeout)
+        self.client = client
+        self._owns_client = owns_client
         
-        # Circuit breakers per endpoint
-        self.circuit_breakers: Dict[str, CircuitBreaker] = {
-            'pokemon': CircuitBreaker(),
-            'type': CircuitBreaker(),
-            'ability': CircuitBreaker(),
-        }
+        # Circuit breakers per endpoint, indexed via _CB_INDEX
+        self._cbs = tuple(CircuitBreaker(name=name) for name in self._CB_INDEX)
+    
+    @cached_property
+    def circuit_breakers(self) -> Dict[str, CircuitBreaker]:
+        """Circuit breakers keyed by endpoint name."""
+        return {name: self._cbs[index] for name, index in self._CB_INDEX.items()}
+    
+    def _resolve_cb(self, endpoint_name: str) -> Optional[CircuitBreaker]:
+        """
+        Get the circuit breaker for an endpoint.
+        
+        Args:
+            endpoint_name: Endpoint name ('pokemon', 'type', 'ability')
+            
+        Returns:
+            CircuitBreaker instance, or None for unknown endpoints
+        """
+        index = self._CB_INDEX.get(endpoint_name)
+        if index is None:
+            return None
+        return self._cbs[index]
     
     async def close(self) -> None:
-        """Close the HTTP client and cleanup resources."""
-        await self.client.aclose()
+        """
+        Close the HTTP client and cleanup resources.
+        
+        No-op for clients this instance does not own, so the shared
+        client is not closed mid-suite.
+        """
+        if self._owns_client:
+            await self.client.aclose()
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -95,17 +172,21 @@ class PokeAPIClient:
         """Async context manager exit."""
         await self.close()
     
-    def _add_jitter(self, delay: float) -> float:
+    def _full_jitter(self, attempt: int) -> float:
         """
-        Add random jitter to delay to prevent thundering herd.
+        Calculate a "full jitter" backoff delay to prevent thundering herd.
+        
+        The delay is drawn uniformly from the whole backoff window rather
+        than adding a small offset to it, so retries stay spread out even
+        at high attempt counts.
         
         Args:
-            delay: Base delay in seconds
+            attempt: Zero-based retry attempt number
             
         Returns:
-            Delay with added jitter (0-1 second)
+            Delay in seconds between 0 and min(max_backoff, 2^attempt)
         """
-        return delay + random.uniform(0, 1)
+        return random.uniform(0, min(self.max_backoff, 2 ** attempt))
     
     async def _handle_rate_limit(self, response: httpx.Response) -> None:
         """
@@ -126,27 +207,24 @@ class PokeAPIClient:
             # No Retry-After header, use exponential backoff
             wait_time = 1.0
         
-        # Add jitter to prevent synchronized retries
-        wait_time = self._add_jitter(wait_time)
+        # Spread retries across the Retry-After window (full jitter)
+        # to prevent synchronized retries
+        wait_time = random.uniform(0, min(wait_time, self.max_backoff))
         
-        logger.warning(
-            f"Rate limited (429). Waiting {wait_time:.2f}s before retry"
-        )
+        logger.warning("Rate limited (429). Waiting %.2fs before retry", wait_time)
         await asyncio.sleep(wait_time)
     
     async def _make_request(
         self,
-        url: str,
-        endpoint_name: str,
-        retry_count: int = 0
+        url: httpx.URL,
+        endpoint_name: str
     ) -> Dict[str, Any]:
         """
-        Make an HTTP request with error handling and retries.
+        Make an HTTP request and decode the JSON response.
         
         Args:
-            url: Full URL to request
+            url: Full URL to request (pre-parsed, from tests.api.endpoints)
             endpoint_name: Endpoint name for metrics/circuit breaker
-            retry_count: Current retry attempt number
             
         Returns:
             JSON response as dictionary
@@ -156,145 +234,141 @@ class PokeAPIClient:
             httpx.RequestError: For network errors
             CircuitBreakerOpenError: If circuit breaker is open
         """
-        import time
-        
-        # Acquire rate limiter token if configured
-        if self.rate_limiter:
-            await self.rate_limiter.acquire()
-        
-        # Get circuit breaker for this endpoint
-        circuit_breaker = self.circuit_breakers.get(endpoint_name)
-        
-        # Check if circuit is open
-        if circuit_breaker and circuit_breaker.is_open():
-            if self.metrics_collector:
-                self.metrics_collector.increment_failure_counter(
-                    endpoint_name,
-                    'circuit_open'
-                )
-            raise CircuitBreakerOpenError(
-                f"Circuit breaker is open for endpoint: {endpoint_name}"
-            )
-        
-        start_time = time.time()
-        
-        try:
-            # Make the HTTP request
-            response = await self.client.get(url)
-            
-            # Handle rate limiting
-            if response.status_code == 429:
-                if retry_count < self.max_retries:
-                    await self._handle_rate_limit(response)
-                    return await self._make_request(url, endpoint_name, retry_count + 1)
-                else:
-                    if self.metrics_collector:
-                        self.metrics_collector.increment_failure_counter(
-                            endpoint_name,
-                            'rate_limit_exceeded'
-                        )
-                    response.raise_for_status()
-            
-            # Raise for other HTTP errors
-            response.raise_for_status()
-            
-            # Record success metrics
-            duration = time.time() - start_time
-            if self.metrics_collector:
-                self.metrics_collector.increment_request_counter(endpoint_name)
-                self.metrics_collector.record_latency(endpoint_name, duration)
-            
-            # Record success in circuit breaker
-            if circuit_breaker:
-                await circuit_breaker.record_success()
-            
-            return response.json()
-            
-        except httpx.HTTPStatusError as e:
-            # HTTP error (4xx, 5xx)
-            duration = time.time() - start_time
-            
-            if self.metrics_collector:
-                self.metrics_collector.increment_failure_counter(
-                    endpoint_name,
-                    f'http_{e.response.status_code}'
-                )
-                self.metrics_collector.record_latency(endpoint_name, duration)
-            
-            # Record failure in circuit breaker
-            if circuit_breaker:
-                await circuit_breaker.record_failure()
-            
-            logger.error(
-                f"HTTP error for {endpoint_name}: {e.response.status_code} - {e}"
-            )
-            raise
-            
-        except httpx.RequestError as e:
-            # Network error (timeout, connection error, etc.)
-            duration = time.time() - start_time
-            
-            if self.metrics_collector:
-                self.metrics_collector.increment_failure_counter(
-                    endpoint_name,
-                    'network_error'
-                )
-                self.metrics_collector.record_latency(endpoint_name, duration)
-            
-            # Record failure in circuit breaker
-            if circuit_breaker:
-                await circuit_breaker.record_failure()
-            
-            logger.error(f"Network error for {endpoint_name}: {e}")
-            raise
+        return orjson.loads(await self._make_request_bytes(url, endpoint_name))
     
-    async def _request_with_retry(
+    async def _make_request_bytes(
         self,
-        url: str,
+        url: httpx.URL,
         endpoint_name: str
-    ) -> Dict[str, Any]:
+    ) -> bytes:
         """
-        Make request with exponential backoff retry logic.
+        Make an HTTP request with error handling and retries.
+        
+        All retries (429 and transient failures) run in a single loop
+        bounded by max_retries so each attempt is counted exactly once in
+        metrics and in the circuit breaker. A rate limiter token is acquired
+        per attempt, since every attempt is a real request against the API.
         
         Args:
-            url: Full URL to request
-            endpoint_name: Endpoint name for metrics
+            url: Full URL to request (pre-parsed, from tests.api.endpoints)
+            endpoint_name: Endpoint name for metrics/circuit breaker
             
         Returns:
-            JSON response as dictionary
+            Raw response body
+            
+        Raises:
+            httpx.HTTPError: For HTTP errors
+            httpx.RequestError: For network errors
+            CircuitBreakerOpenError: If circuit breaker is open
         """
-        last_exception = None
+        # Get circuit breaker for this endpoint
+        circuit_breaker = self._resolve_cb(endpoint_name)
         
-        for attempt in range(self.max_retries + 1):
+        attempt = 0
+        while True:
+            # Acquire rate limiter token if configured
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+            
+            # Check if circuit is open
+            if circuit_breaker and circuit_breaker.is_open():
+                if self.metrics_collector:
+                    self.metrics_collector.increment_failure_counter(
+                        endpoint_name,
+                        'circuit_open'
+                    )
+                raise circuit_breaker.open_error() from None
+            
+            start_time = perf_counter()
+            
             try:
-                return await self._make_request(url, endpoint_name)
-            except (httpx.RequestError, httpx.HTTPStatusError) as e:
-                last_exception = e
+                # Make the HTTP request
+                response = await self.client.get(url, timeout=self._request_timeout)
+                
+                # Handle rate limiting
+                if response.status_code == 429:
+                    if attempt < self.max_retries:
+                        attempt += 1
+                        await self._handle_rate_limit(response)
+                        continue
+                    if self.metrics_collector:
+                        self.metrics_collector.increment_failure_counter(
+                            endpoint_name,
+                            'rate_limit_exceeded'
+                        )
                 
-                # Don't retry on client errors (except 429 which is handled separately)
-                if isinstance(e, httpx.HTTPStatusError):
-                    if 400 <= e.response.status_code < 500 and e.response.status_code != 429:
-                        raise
+                # Raise for HTTP errors
+                response.raise_for_status()
                 
-                # Don't retry if this was the last attempt
-                if attempt >= self.max_retries:
-                    break
+                # Record success metrics
+                duration = perf_counter() - start_time
+                if self.metrics_collector:
+                    self.metrics_collector.increment_request_counter(endpoint_name)
+                    self.metrics_collector.record_latency(endpoint_name, duration)
                 
-                # Calculate exponential backoff with jitter
-                # 2^attempt seconds: 1s, 2s, 4s
-                wait_time = 2 ** attempt
-                wait_time = self._add_jitter(wait_time)
+                # Record success in circuit breaker
+                if circuit_breaker:
+                    await circuit_breaker.record_success()
                 
-                logger.warning(
-                    f"Request failed (attempt {attempt + 1}/{self.max_retries + 1}). "
-                    f"Retrying in {wait_time:.2f}s..."
+                return response.content
+                
+            except httpx.HTTPStatusError as e:
+                # HTTP error (4xx, 5xx)
+                duration = perf_counter() - start_time
+                
+                if self.metrics_collector:
+                    self.metrics_collector.increment_failure_counter(
+                        endpoint_name,
+                        f'http_{e.response.status_code}'
+                    )
+                    self.metrics_collector.record_latency(endpoint_name, duration)
+                
+                # Record failure in circuit breaker
+                if circuit_breaker:
+                    await circuit_breaker.record_failure()
+                
+                logger.error(
+                    "HTTP error for %s: %s - %s", endpoint_name, e.response.status_code, e
                 )
                 
-                await asyncio.sleep(wait_time)
-        
-        # All retries exhausted
-        if last_exception:
-            raise last_exception
+                # Don't retry on client errors or once retries are exhausted
+                if 400 <= e.response.status_code < 500 or attempt >= self.max_retries:
+                    raise
+                
+            except httpx.RequestError as e:
+                # Network error (timeout, connection error, etc.)
+                duration = perf_counter() - start_time
+                
+                if self.metrics_collector:
+                    self.metrics_collector.increment_failure_counter(
+                        endpoint_name,
+                        'network_error'
+                    )
+                    self.metrics_collector.record_latency(endpoint_name, duration)
+                
+                # Record failure in circuit breaker
+                if circuit_breaker:
+                    await circuit_breaker.record_failure()
+                
+                logger.error("Network error for %s: %s", endpoint_name, e)
+                
+                if attempt >= self.max_retries:
+                    raise
+            
+            # Calculate exponential backoff with full jitter
+            # Windows of 2^attempt seconds: 1s, 2s, 4s (capped at max_backoff)
+            wait_time = self._full_jitter(attempt)
+            
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Request failed (attempt %d/%d). Retrying in %.2fs...",
+                    attempt + 1,
+                    self.max_retries + 1,
+                    wait_time,
+                )
+            
+            attempt += 1
+            await asyncio.sleep(wait_time)
     
     async def get_pokemon(self, pokemon_id: int) -> Dict[str, Any]:
         """
@@ -312,7 +386,7 @@ class PokeAPIClient:
             CircuitBreakerOpenError: If circuit breaker is open
         """
         url = get_pokemon_url(pokemon_id)
-        return await self._request_with_retry(url, 'pokemon')
+        return await self._make_request(url, 'pokemon')
     
     async def get_type(self, type_id: int) -> Dict[str, Any]:
         """
@@ -330,7 +404,7 @@ class PokeAPIClient:
             CircuitBreakerOpenError: If circuit breaker is open
         """
         url = get_type_url(type_id)
-        return await self._request_with_retry(url, 'type')
+        return await self._make_request(url, 'type')
     
     async def get_ability(self, ability_id: int) -> Dict[str, Any]:
         """
@@ -348,7 +422,80 @@ class PokeAPIClient:
             CircuitBreakerOpenError: If circuit breaker is open
         """
         url = get_ability_url(ability_id)
-        return await self._request_with_retry(url, 'ability')
+        return await self._make_request(url, 'ability')
+    
+    async def get_pokemon_model(self, pokemon_id: int) -> Pokemon:
+        """
+        Get Pokemon data by ID, validated as a Pokemon model.
+        
+        The raw body is validated directly by Pydantic, skipping the
+        intermediate dictionary.
+        
+        Args:
+            pokemon_id: Pokemon ID (e.g., 1 for Bulbasaur)
+            
+        Returns:
+            Validated Pokemon model
+        """
+        url = get_pokemon_url(pokemon_id)
+        return parse_pokemon(await self._make_request_bytes(url, 'pokemon'))
+    
+    async def get_type_model(self, type_id: int) -> Type:
+        """
+        Get Type data by ID, validated as a Type model.
+        
+        Args:
+            type_id: Type ID (e.g., 1 for Normal)
+            
+        Returns:
+            Validated Type model
+        """
+        url = get_type_url(type_id)
+        return parse_type(await self._make_request_bytes(url, 'type'))
+    
+    async def get_ability_model(self, ability_id: int) -> Ability:
+        """
+        Get Ability data by ID, validated as an Ability model.
+        
+        Args:
+            ability_id: Ability ID (e.g., 1 for Stench)
+            
+        Returns:
+            Validated Ability model
+        """
+        url = get_ability_url(ability_id)
+        return parse_ability(await self._make_request_bytes(url, 'ability'))
+    
+    async def get_many(
+        self,
+        getter: Callable[[int], Awaitable[Any]],
+        ids: Iterable[int],
+        concurrency: int = 20,
+    ) -> List[Any]:
+        """
+        Fetch many resources concurrently.
+        
+        Requests are issued together and bounded by a semaphore so the
+        number in flight does not exceed the keep-alive pool size.
+        
+        Args:
+            getter: Bound getter method (e.g., client.get_pokemon)
+            ids: Resource IDs to fetch
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            List of getter results in the same order as ids
+            
+        Example:
+            pokemon = await client.get_many(client.get_pokemon, range(1, 152))
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch_one(resource_id: int) -> Any:
+            async with semaphore:
+                return await getter(resource_id)
+        
+        return await asyncio.gather(*(fetch_one(i) for i in ids))
     
     def get_circuit_breaker_state(self, endpoint: str) -> int:
         """
@@ -360,7 +507,7 @@ class PokeAPIClient:
         Returns:
             Circuit state value (0=CLOSED, 1=OPEN, 2=HALF_OPEN)
         """
-        circuit_breaker = self.circuit_breakers.get(endpoint)
+        circuit_breaker = self._resolve_cb(endpoint)
         if circuit_breaker:
             return circuit_breaker.get_state_value()
         return 0
@@ -5,6 +5,8 @@ Defines base URL and endpoint paths for the PokéAPI service.
 """
 
 import os
+from functools import lru_cache
+import httpx
 
 # Base URL for PokéAPI (can be overridden via environment variable)
 BASE_URL = os.getenv('POKEAPI_BASE_URL', 'https://pokeapi.co/api/v2')
@@ -15,14 +17,19 @@ TYPE_ENDPOINT = 'type'
 ABILITY_ENDPOINT = 'ability'
 
 # Full endpoint URLs
-def get_pokemon_url(pokemon_id: int) -> str:
+# BASE_URL is fixed at import time, so URLs are cached by resource ID alone.
+# Returning parsed httpx.URL objects lets requests skip URL parsing.
+@lru_cache(maxsize=2048)
+def get_pokemon_url(pokemon_id: int) -> httpx.URL:
     """Get full URL for pokemon endpoint."""
-    return f"{BASE_URL}/{POKEMON_ENDPOINT}/{pokemon_id}"
+    return httpx.URL(f"{BASE_URL}/{POKEMON_ENDPOINT}/{pokemon_id}")
 
-def get_type_url(type_id: int) -> str:
+@lru_cache(maxsize=2048)
+def get_type_url(type_id: int) -> httpx.URL:
     """Get full URL for type endpoint."""
-    return f"{BASE_URL}/{TYPE_ENDPOINT}/{type_id}"
+    return httpx.URL(f"{BASE_URL}/{TYPE_ENDPOINT}/{type_id}")
 
-def get_ability_url(ability_id: int) -> str:
+@lru_cache(maxsize=2048)
+def get_ability_url(ability_id: int) -> httpx.URL:
     """Get full URL for ability endpoint."""
-    return f"{BASE_URL}/{ABILITY_ENDPOINT}/{ability_id}"
+    return httpx.URL(f"{BASE_URL}/{ABILITY_ENDPOINT}/{ability_id}")
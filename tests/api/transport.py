@@ -0,0 +1,166 @@
+"""
+HTTPX transport configuration for the shared PokéAPI client.
+
+Provides:
+- DNS resolution cached for the process lifetime
+- TCP socket tuning (Nagle disabled, keep-alive probes enabled)
+- Transport factory used by the shared client and test fixtures
+"""
+
+import socket
+from typing import Dict, Iterable, List, Optional, Tuple
+import anyio
+import httpcore
+import httpx
+
+
+# Resolved addresses keyed by (host, port), in the order to try them
+_DNS_CACHE: Dict[Tuple[str, int], List[str]] = {}
+
+# Socket options applied to every connection: disable Nagle's algorithm so
+# small GET requests are sent immediately, and keep idle pooled
+# connections alive at the TCP level
+SOCKET_OPTIONS: List[httpcore.SOCKET_OPTION] = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class CachingResolverBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that memoizes DNS lookups.
+
+    Hostnames are resolved once and the addresses are reused for every new
+    connection, so lookups don't hit the system resolver (and a worker
+    thread) per connection. Like the default backend, every resolved
+    address is tried in turn (e.g. IPv4 after an unreachable IPv6 one),
+    and the one that worked is tried first next time. TLS still uses the
+    original hostname for SNI and certificate checks, since httpcore
+    passes it separately.
+    """
+
+    def __init__(self, backend: Optional[httpcore.AsyncNetworkBackend] = None):
+        """
+        Initialize the backend.
+
+        Args:
+            backend: Backend to delegate connections to (defaults to AnyIOBackend)
+        """
+        self._backend = backend or httpcore.AnyIOBackend()
+
+    async def _resolve(self, host: str, port: int) -> List[str]:
+        """
+        Resolve a hostname, using the cache when possible.
+        
+        Args:
+            host: Hostname or IP address
+            port: Port number
+            
+        Returns:
+            Resolved IP addresses, in the order to try them
+            
+        Raises:
+            httpcore.ConnectError: If the hostname cannot be resolved
+        """
+        key = (host, port)
+        addresses = _DNS_CACHE.get(key)
+        
+        if addresses is None:
+            try:
+                infos = await anyio.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except OSError as e:
+                # Surface lookup failures as connection errors, as httpcore does
+                raise httpcore.ConnectError(str(e)) from e
+            # Keep resolver order, dropping duplicates across address families
+            addresses = list(dict.fromkeys(info[4][0] for info in infos))
+            if not addresses:
+                raise httpcore.ConnectError(f"No addresses found for {host}")
+            _DNS_CACHE[key] = addresses
+        
+        return addresses
+    
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[httpcore.SOCKET_OPTION]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        """Open a TCP connection to the first reachable cached address for host."""
+        addresses = await self._resolve(host, port)
+        
+        error: Optional[httpcore.ConnectError] = None
+        for index, address in enumerate(addresses):
+            try:
+                stream = await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except httpcore.ConnectError as e:
+                error = e
+                continue
+            
+            if index:
+                # Try the address that worked first from now on
+                _DNS_CACHE[(host, port)] = [address] + addresses[:index] + addresses[index + 1:]
+            return stream
+        
+        # No address was reachable; the cached ones may be stale, so
+        # resolve again next time
+        _DNS_CACHE.pop((host, port), None)
+        raise error
+    
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable[httpcore.SOCKET_OPTION]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        """Open a Unix socket connection (no resolution needed)."""
+        return await self._backend.connect_unix_socket(
+            path,
+            timeout=timeout,
+            socket_options=socket_options,
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        """Sleep using the wrapped backend."""
+        await self._backend.sleep(seconds)
+
+
+def clear_dns_cache() -> None:
+    """Clear cached DNS lookups."""
+    _DNS_CACHE.clear()
+
+
+def create_transport(
+    limits: httpx.Limits,
+    http2: bool = True,
+) -> httpx.AsyncHTTPTransport:
+    """
+    Create an HTTPX transport with cached DNS resolution and tuned sockets.
+
+    Args:
+        limits: Connection pool limits
+        http2: Whether to enable HTTP/2
+
+    Returns:
+        Configured httpx.AsyncHTTPTransport
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=limits,
+        retries=0,
+        socket_options=SOCKET_OPTIONS,
+    )
+
+    # httpx has no public option for the network backend, so wrap the one
+    # its connection pool created
+    pool = transport._pool
+    pool._network_backend = CachingResolverBackend(pool._network_backend)
+
+    return transport
@@ -3,9 +3,67 @@ Pytest configuration and fixtures for the test suite.
 Provides shared fixtures for database connections, API clients, and test utilities.
 """
 
+import asyncio
+import httpx
 import pytest
+import pytest_asyncio
 import os
+from tests.api.client import PokeAPIClient, close_shared_client
+from tests.api.transport import create_transport
 from tests.utils.database import ResponseRepository
+from tests.utils.async_database import AsyncResponseRepository
+
+# Use the libuv-based event loop when available (not supported on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    Provide a single event loop for the whole test session.
+    Session-scoped so the shared HTTP client's connections stay usable.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def shared_http_client():
+    """
+    Close the shared HTTPX client once the test session finishes.
+    """
+    yield
+    await close_shared_client()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def api_client():
+    """
+    Provide a PokeAPIClient backed by a single HTTP/2 connection pool.
+    Session-scoped so all tests multiplex over the same connections.
+    """
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    http_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(10.0),
+        transport=create_transport(limits, http2=True),
+        follow_redirects=True,
+    )
+    async with PokeAPIClient(client=http_client, owns_client=True) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def gen1_pokemon(api_client):
+    """
+    Provide the 151 generation-1 Pokemon responses, fetched concurrently.
+    Session-scoped so the data is loaded in one shot and reused.
+    """
+    return await api_client.get_many(api_client.get_pokemon, range(1, 152))
 
 
 @pytest.fixture(scope="session")
@@ -23,26 +81,38 @@ def db_config():
     }
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def db_repository(db_config):
     """
-    Provide a ResponseRepository instance for database operations.
-    Function-scoped to ensure clean state for each test.
+    Provide a ResponseRepository backed by its own connection pool.
+    Session-scoped so connection setup is paid once for the whole suite;
+    use clean_db for per-test clean state.
     """
     repo = ResponseRepository(**db_config)
     yield repo
-    # Cleanup: Clear test data after each test
-    # Note: In production, you might want more selective cleanup
+    repo.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_db_repository(db_config):
+    """
+    Provide an AsyncResponseRepository backed by an asyncpg pool.
+    Session-scoped so the pool is created once; combine with clean_db
+    for per-test clean state.
+    """
+    async with AsyncResponseRepository(**db_config) as repo:
+        yield repo
 
 
 @pytest.fixture(scope="function")
 def clean_db(db_repository):
     """
     Provide a clean database state for tests.
-    Clears all responses before and after the test.
+    Truncates the responses table before and after the test; the pooled
+    session-scoped repository is reused, so no connection setup is repeated.
     """
     # Clear before test
-    db_repository.clear_responses()
+    db_repository.truncate_responses()
     yield db_repository
     # Clear after test
-    db_repository.clear_responses()
+    db_repository.truncate_responses()
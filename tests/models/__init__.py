@@ -7,7 +7,7 @@ This module provides data validation models for the following endpoints:
 - /ability/{id}
 
 All models are configured with extra="allow" for forward compatibility
-with API changes.
+with API changes, and frozen=True so validated instances are immutable.
 """
 
 from tests.models.pokemon import (
@@ -16,9 +16,20 @@ from tests.models.pokemon import (
     PokemonAbility,
     PokemonStat,
     PokemonSprite,
+    parse_pokemon,
+)
+from tests.models.type import (
+    Type,
+    TypePokemon,
+    MoveReference,
+    parse_type,
+)
+from tests.models.ability import (
+    Ability,
+    AbilityPokemon,
+    EffectEntry,
+    parse_ability,
 )
-from tests.models.type import Type, TypePokemon
-from tests.models.ability import Ability, EffectEntry
 
 __all__ = [
     "Pokemon",
@@ -26,8 +37,13 @@ __all__ = [
     "PokemonAbility",
     "PokemonStat",
     "PokemonSprite",
+    "parse_pokemon",
     "Type",
     "TypePokemon",
+    "MoveReference",
+    "parse_type",
     "Ability",
+    "AbilityPokemon",
     "EffectEntry",
+    "parse_ability",
 ]
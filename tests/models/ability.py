@@ -2,11 +2,14 @@
 Pydantic models for PokéAPI /ability/{id} endpoint.
 
 These models validate the structure and types of Ability data returned
-from the PokéAPI. All models allow extra fields for forward compatibility.
+from the PokéAPI. All models allow extra fields for forward compatibility
+and are frozen (immutable) once validated.
 """
 
-from typing import List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import List
+from pydantic import BaseModel, ConfigDict, Field
+
+from tests.models.type import PokemonReference
 
 
 class LanguageReference(BaseModel):
@@ -15,8 +18,7 @@ class LanguageReference(BaseModel):
     name: str = Field(..., description="Name of the language")
     url: str = Field(..., description="URL to the language resource")
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class EffectEntry(BaseModel):
@@ -26,8 +28,17 @@ class EffectEntry(BaseModel):
     language: LanguageReference = Field(..., description="Language reference")
     short_effect: str = Field(..., description="Short effect description")
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+
+class AbilityPokemon(BaseModel):
+    """Pokemon that can have this ability."""
+
+    is_hidden: bool = Field(..., description="Whether this is a hidden ability")
+    slot: int = Field(..., description="Slot position of this ability for the Pokemon")
+    pokemon: PokemonReference = Field(..., description="Pokemon reference")
+
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class Ability(BaseModel):
@@ -46,9 +57,25 @@ class Ability(BaseModel):
     effect_entries: List[EffectEntry] = Field(
         ..., description="List of effect descriptions in different languages"
     )
-    pokemon: List[Dict[str, Any]] = Field(
+    pokemon: List[AbilityPokemon] = Field(
         ..., description="List of Pokemon with this ability"
     )
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+
+def parse_ability(raw: bytes) -> Ability:
+    """
+    Validate a raw /ability/{id} response body into an Ability model.
+
+    Every call returns a new instance. Results are not memoized: frozen
+    models still hold mutable lists, so a shared instance could be
+    changed under other callers.
+
+    Args:
+        raw: Raw JSON response body
+
+    Returns:
+        Validated Ability instance
+    """
+    return Ability.model_validate_json(raw)
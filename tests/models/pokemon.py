@@ -2,11 +2,12 @@
 Pydantic models for PokéAPI /pokemon/{id} endpoint.
 
 These models validate the structure and types of Pokemon data returned
-from the PokéAPI. All models allow extra fields for forward compatibility.
+from the PokéAPI. All models allow extra fields for forward compatibility
+and are frozen (immutable) once validated.
 """
 
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TypeReference(BaseModel):
@@ -15,8 +16,7 @@ class TypeReference(BaseModel):
     name: str = Field(..., description="Name of the type")
     url: str = Field(..., description="URL to the type resource")
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class PokemonType(BaseModel):
@@ -25,8 +25,7 @@ class PokemonType(BaseModel):
     slot: int = Field(..., description="Slot position of this type")
     type: TypeReference = Field(..., description="Type reference")
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class AbilityReference(BaseModel):
@@ -35,8 +34,7 @@ class AbilityReference(BaseModel):
     name: str = Field(..., description="Name of the ability")
     url: str = Field(..., description="URL to the ability resource")
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class PokemonAbility(BaseModel):
@@ -46,8 +44,7 @@ class PokemonAbility(BaseModel):
     slot: int = Field(..., description="Slot position of this ability")
     ability: AbilityReference = Field(..., description="Ability reference")
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class StatReference(BaseModel):
@@ -56,8 +53,7 @@ class StatReference(BaseModel):
     name: str = Field(..., description="Name of the stat")
     url: str = Field(..., description="URL to the stat resource")
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class PokemonStat(BaseModel):
@@ -67,8 +63,7 @@ class PokemonStat(BaseModel):
     effort: int = Field(..., description="Effort points gained for this stat")
     stat: StatReference = Field(..., description="Stat reference")
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class PokemonSprite(BaseModel):
@@ -87,8 +82,7 @@ class PokemonSprite(BaseModel):
         None, description="Shiny female back sprite URL"
     )
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class Pokemon(BaseModel):
@@ -117,5 +111,21 @@ class Pokemon(BaseModel):
     )
     sprites: PokemonSprite = Field(..., description="Sprite URLs")
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+
+def parse_pokemon(raw: bytes) -> Pokemon:
+    """
+    Validate a raw /pokemon/{id} response body into a Pokemon model.
+
+    Every call returns a new instance. Results are not memoized: frozen
+    models still hold mutable lists, so a shared instance could be
+    changed under other callers.
+
+    Args:
+        raw: Raw JSON response body
+
+    Returns:
+        Validated Pokemon instance
+    """
+    return Pokemon.model_validate_json(raw)
@@ -2,11 +2,12 @@
 Pydantic models for PokéAPI /type/{id} endpoint.
 
 These models validate the structure and types of Type data returned
-from the PokéAPI. All models allow extra fields for forward compatibility.
+from the PokéAPI. All models allow extra fields for forward compatibility
+and are frozen (immutable) once validated.
 """
 
 from typing import List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PokemonReference(BaseModel):
@@ -15,8 +16,7 @@ class PokemonReference(BaseModel):
     name: str = Field(..., description="Name of the Pokemon")
     url: str = Field(..., description="URL to the Pokemon resource")
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class TypePokemon(BaseModel):
@@ -25,8 +25,16 @@ class TypePokemon(BaseModel):
     slot: int = Field(..., description="Slot position of this type for the Pokemon")
     pokemon: PokemonReference = Field(..., description="Pokemon reference")
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+
+class MoveReference(BaseModel):
+    """Reference to a move."""
+
+    name: str = Field(..., description="Name of the move")
+    url: str = Field(..., description="URL to the move resource")
+
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class Type(BaseModel):
@@ -45,9 +53,25 @@ class Type(BaseModel):
     pokemon: List[TypePokemon] = Field(
         ..., description="List of Pokemon with this type"
     )
-    moves: List[Dict[str, Any]] = Field(
+    moves: List[MoveReference] = Field(
         ..., description="List of moves of this type"
     )
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+
+def parse_type(raw: bytes) -> Type:
+    """
+    Validate a raw /type/{id} response body into a Type model.
+
+    Every call returns a new instance. Results are not memoized: frozen
+    models still hold mutable lists, so a shared instance could be
+    changed under other callers.
+
+    Args:
+        raw: Raw JSON response body
+
+    Returns:
+        Validated Type instance
+    """
+    return Type.model_validate_json(raw)
@@ -4,7 +4,10 @@ These tests can run independently to verify the module structure.
 """
 
 import pytest
-from tests.utils.database import ResponseRepository
+from psycopg2.pool import ThreadedConnectionPool
+from tests.utils import database
+from tests.utils.database import ResponseRepository, OrJson, PREPARED_STATEMENTS
+from tests.utils.async_database import AsyncResponseRepository, LARGE_JSON_THRESHOLD
 
 
 def test_response_repository_initialization():
@@ -35,6 +38,22 @@ def test_response_repository_custom_config():
     assert repo.password == 'custom-pass'
 
 
+def test_response_repository_creates_pool_lazily():
+    """Test that the repository's own pool is only created on first use."""
+    repo = ResponseRepository()
+    
+    assert repo.pool is None
+    repo.close()
+    assert repo.pool is None
+
+
+def test_orjson_adapter_serializes_compactly():
+    """Test that the OrJson adapter produces orjson's compact UTF-8 JSON."""
+    adapter = OrJson({'name': 'flabébé', 'stats': [1, 2.5, None]})
+    
+    assert adapter.dumps(adapter.adapted) == '{"name":"flabébé","stats":[1,2.5,null]}'
+
+
 @pytest.mark.skipif(
     True,  # Skip by default - requires database
     reason="Requires PostgreSQL database connection"
@@ -47,3 +66,117 @@ def test_database_connection(db_repository):
             cursor.execute("SELECT 1")
             result = cursor.fetchone()
             assert result[0] == 1
+
+
+def test_async_response_repository_defers_pool_creation():
+    """Test that AsyncResponseRepository only connects once init() is awaited."""
+    repo = AsyncResponseRepository(host='custom-host', port=5433, max_size=4)
+    
+    assert repo.host == 'custom-host'
+    assert repo.port == 5433
+    assert repo.max_size == 4
+    assert repo.pool is None
+    
+    with pytest.raises(RuntimeError):
+        repo._get_pool()
+
+
+@pytest.mark.xdist_group("database")
+@pytest.mark.asyncio
+async def test_async_repository_round_trip(clean_db, async_db_repository):
+    """Test that responses stored through asyncpg read back with orjson-decoded JSONB."""
+    response_data = {'id': 1, 'name': 'bulbasaur', 'types': [{'slot': 1}], 'weight': 6.9}
+    
+    record_id = await async_db_repository.store_response('pokemon', 1, response_data)
+    stored = await async_db_repository.get_latest_response('pokemon', 1)
+    
+    assert stored.id == record_id
+    assert stored.response_data == response_data
+    
+    # Rows written via asyncpg are visible to the psycopg2 repository too
+    assert clean_db.get_latest_response('pokemon', 1).response_data == response_data
+    
+    assert await async_db_repository.clear_responses('pokemon') == 1
+
+
+@pytest.mark.xdist_group("database")
+@pytest.mark.asyncio
+async def test_async_repository_bulk_copy(clean_db, async_db_repository):
+    """Test that bulk COPY stores every row, keeping order for repeated resources."""
+    rows = [
+        ('pokemon', 1, {'name': 'bulbasaur', 'version': 1}),
+        ('type', 1, {'name': 'normal'}),
+        ('pokemon', 1, {'name': 'bulbasaur', 'version': 2}),
+    ]
+    
+    assert await async_db_repository.store_responses_bulk(rows) == 3
+    
+    history = await async_db_repository.get_all_responses('pokemon', 1)
+    assert [r.response_data['version'] for r in history] == [2, 1]
+    assert (await async_db_repository.get_latest_response('type', 1)).response_data == {'name': 'normal'}
+
+
+@pytest.mark.xdist_group("database")
+def test_get_all_responses_streams_history(clean_db):
+    """Test that response history is streamed newest first from a server-side cursor."""
+    clean_db.store_responses_bulk([
+        ('pokemon', 1, {'name': 'bulbasaur', 'version': version})
+        for version in range(3)
+    ])
+    
+    history = clean_db.get_all_responses('pokemon', 1)
+    
+    assert not isinstance(history, list)
+    assert [r.response_data['version'] for r in history] == [2, 1, 0]
+    assert list(clean_db.get_all_responses('pokemon', 2)) == []
+
+
+@pytest.mark.xdist_group("database")
+def test_prepared_statements_round_trip(clean_db):
+    """Test that prepared statements are created once per connection and reused."""
+    schema = {'id': 'int', 'name': 'str'}
+    
+    clean_db.store_schema_version('pokemon', schema)
+    clean_db.store_schema_version('pokemon', {**schema, 'height': 'int'})
+    
+    assert clean_db.get_latest_schema('pokemon').schema_structure == {**schema, 'height': 'int'}
+    assert clean_db.get_latest_schema('ability') is None
+    
+    with clean_db.get_connection() as conn:
+        assert conn in database._PREPARED_CONNECTIONS
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT count(*) FROM pg_prepared_statements")
+            assert cursor.fetchone()[0] == len(PREPARED_STATEMENTS)
+
+
+@pytest.mark.xdist_group("database")
+def test_repositories_sharing_a_pool_prepare_once(clean_db, db_config):
+    """Test that repositories sharing a pool don't prepare a connection twice."""
+    pool = ThreadedConnectionPool(1, 1, **db_config)
+    try:
+        first = ResponseRepository(pool=pool)
+        second = ResponseRepository(pool=pool)
+        
+        first.store_response('pokemon', 1, {'name': 'bulbasaur'})
+        second.store_response('pokemon', 2, {'name': 'ivysaur'})
+        
+        assert first.get_latest_response('pokemon', 2).response_data == {'name': 'ivysaur'}
+        assert second.get_latest_response('pokemon', 1).response_data == {'name': 'bulbasaur'}
+    finally:
+        pool.closeall()
+
+
+@pytest.mark.xdist_group("database")
+@pytest.mark.asyncio
+async def test_async_repository_decodes_large_responses(clean_db, async_db_repository):
+    """Test that responses above the threshold are decoded off the loop intact."""
+    large = {'name': 'bulbasaur', 'moves': ['x' * 100] * (LARGE_JSON_THRESHOLD // 100)}
+    await async_db_repository.store_responses_bulk([
+        ('pokemon', 1, {'name': 'bulbasaur'}),
+        ('pokemon', 1, large),
+    ])
+    
+    assert (await async_db_repository.get_latest_response('pokemon', 1)).response_data == large
+    
+    history = await async_db_repository.get_all_responses('pokemon', 1)
+    assert [r.response_data for r in history] == [large, {'name': 'bulbasaur'}]
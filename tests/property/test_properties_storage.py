@@ -5,24 +5,93 @@ These tests verify that API responses are correctly stored in the database
 and that historical comparison functionality works as expected.
 """
 
+import hashlib
+import inspect
+import os
+import sys
+import orjson
 import pytest
-from hypothesis import given, strategies as st, settings, HealthCheck
+from hypothesis import given, strategies as st, settings, HealthCheck, Phase
+from hypothesis.database import DirectoryBasedExampleDatabase
 from tests.utils.database import ResponseRepository
 
 
+# clean_db truncates the shared api_responses table, so these tests must not
+# run concurrently on different xdist workers
+pytestmark = pytest.mark.xdist_group("database")
+
+
+# Every example in the database-backed tests is a real write and read, so CI
+# (CI=1) runs fewer examples with a fixed seed and only the generate phase,
+# skipping shrinking and explanation; rerun locally to get a shrunk failure.
+# Local runs keep the full count and persist failing examples so shrunk
+# failures are replayed first. Hypothesis disables the example database
+# when derandomize is set.
+ON_CI = os.getenv('CI', '').lower() in ('1', 'true')
+
+# Live Hypothesis generation for storage tests is opt-in (HYPOTHESIS_EXPLORE=1);
+# regular runs replay the frozen corpus instead
+EXPLORE = os.getenv('HYPOTHESIS_EXPLORE', '').lower() in ('1', 'true')
+
+if ON_CI:
+    DB_SETTINGS = settings(
+        max_examples=25,
+        deadline=None,
+        derandomize=True,
+        phases=(Phase.generate,),
+        suppress_health_check=[HealthCheck.function_scoped_fixture]
+    )
+else:
+    DB_SETTINGS = settings(
+        max_examples=100,
+        deadline=None,
+        database=DirectoryBasedExampleDatabase(".hypothesis/examples"),
+        suppress_health_check=[HealthCheck.function_scoped_fixture]
+    )
+
+
+def canonical_json(value) -> bytes:
+    """
+    Serialize a JSON value with sorted keys for byte-for-byte comparison.
+    
+    Comparing canonical bytes is a single C-level pass instead of Python's
+    recursive dict equality, and it is stricter: 1 and 1.0 serialize
+    differently, so numeric types must survive the JSONB round-trip.
+    """
+    return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+
+
+# Shared text strategies, built once at import instead of on every draw.
+# Use printable characters excluding null bytes for JSON compatibility.
+# Lengths are bounded with max_size rather than filters, so no draws are rejected.
+PRINTABLE_ALPHABET = st.characters(min_codepoint=32, max_codepoint=126)
+SAFE_TEXT = st.text(alphabet=PRINTABLE_ALPHABET, min_size=1)
+SAFE_NAME = st.text(alphabet=PRINTABLE_ALPHABET, min_size=1, max_size=20)
+SAFE_TYPE_NAME = st.text(alphabet=PRINTABLE_ALPHABET, min_size=1, max_size=15)
+SAFE_LANGUAGE_NAME = st.text(alphabet=PRINTABLE_ALPHABET, min_size=1, max_size=10)
+SAFE_URL = st.text(alphabet=PRINTABLE_ALPHABET, min_size=1, max_size=50)
+SAFE_SHORT_EFFECT = st.text(alphabet=PRINTABLE_ALPHABET, min_size=1, max_size=50)
+SAFE_EFFECT = st.text(alphabet=PRINTABLE_ALPHABET, min_size=1, max_size=100)
+
+# Every damage relation kind draws from one shared strategy
+DAMAGE_ENTRY = st.lists(st.dictionaries(SAFE_TEXT, SAFE_TEXT, max_size=2), max_size=2)
+DAMAGE_RELATIONS = st.fixed_dictionaries({
+    'double_damage_from': DAMAGE_ENTRY,
+    'double_damage_to': DAMAGE_ENTRY,
+    'half_damage_from': DAMAGE_ENTRY,
+    'half_damage_to': DAMAGE_ENTRY,
+    'no_damage_from': DAMAGE_ENTRY,
+    'no_damage_to': DAMAGE_ENTRY
+})
+
+
 # Custom strategies for generating test data
 @st.composite
 def pokemon_response(draw):
     """Generate a valid pokemon-like response structure."""
-    # Use printable characters excluding null bytes for JSON compatibility
-    safe_text = st.text(
-        alphabet=st.characters(min_codepoint=32, max_codepoint=126),
-        min_size=1
-    )
-    
     return {
         'id': draw(st.integers(min_value=1, max_value=1000)),
-        'name': draw(safe_text.filter(lambda x: len(x) <= 20)),
+        'name': draw(SAFE_NAME),
         'base_experience': draw(st.integers(min_value=0, max_value=500)),
         'height': draw(st.integers(min_value=1, max_value=200)),
         'weight': draw(st.integers(min_value=1, max_value=1000)),
@@ -30,8 +99,8 @@ def pokemon_response(draw):
             st.fixed_dictionaries({
                 'slot': st.integers(min_value=1, max_value=2),
                 'type': st.fixed_dictionaries({
-                    'name': safe_text.filter(lambda x: len(x) <= 15),
-                    'url': safe_text.filter(lambda x: len(x) <= 50)
+                    'name': SAFE_TYPE_NAME,
+                    'url': SAFE_URL
                 })
             }),
             min_size=1,
@@ -42,8 +111,8 @@ def pokemon_response(draw):
                 'is_hidden': st.booleans(),
                 'slot': st.integers(min_value=1, max_value=3),
                 'ability': st.fixed_dictionaries({
-                    'name': safe_text.filter(lambda x: len(x) <= 20),
-                    'url': safe_text.filter(lambda x: len(x) <= 50)
+                    'name': SAFE_NAME,
+                    'url': SAFE_URL
                 })
             }),
             min_size=1,
@@ -55,29 +124,16 @@ def pokemon_response(draw):
 @st.composite
 def type_response(draw):
     """Generate a valid type-like response structure."""
-    # Use printable characters excluding null bytes for JSON compatibility
-    safe_text = st.text(
-        alphabet=st.characters(min_codepoint=32, max_codepoint=126),
-        min_size=1
-    )
-    
     return {
         'id': draw(st.integers(min_value=1, max_value=20)),
-        'name': draw(safe_text.filter(lambda x: len(x) <= 15)),
-        'damage_relations': draw(st.fixed_dictionaries({
-            'double_damage_from': st.lists(st.dictionaries(safe_text, safe_text, max_size=2), max_size=2),
-            'double_damage_to': st.lists(st.dictionaries(safe_text, safe_text, max_size=2), max_size=2),
-            'half_damage_from': st.lists(st.dictionaries(safe_text, safe_text, max_size=2), max_size=2),
-            'half_damage_to': st.lists(st.dictionaries(safe_text, safe_text, max_size=2), max_size=2),
-            'no_damage_from': st.lists(st.dictionaries(safe_text, safe_text, max_size=2), max_size=2),
-            'no_damage_to': st.lists(st.dictionaries(safe_text, safe_text, max_size=2), max_size=2)
-        })),
+        'name': draw(SAFE_TYPE_NAME),
+        'damage_relations': draw(DAMAGE_RELATIONS),
         'pokemon': draw(st.lists(
             st.fixed_dictionaries({
                 'slot': st.integers(min_value=1, max_value=2),
                 'pokemon': st.fixed_dictionaries({
-                    'name': safe_text.filter(lambda x: len(x) <= 20),
-                    'url': safe_text.filter(lambda x: len(x) <= 50)
+                    'name': SAFE_NAME,
+                    'url': SAFE_URL
                 })
             }),
             max_size=5
@@ -88,23 +144,17 @@ def type_response(draw):
 @st.composite
 def ability_response(draw):
     """Generate a valid ability-like response structure."""
-    # Use printable characters excluding null bytes for JSON compatibility
-    safe_text = st.text(
-        alphabet=st.characters(min_codepoint=32, max_codepoint=126),
-        min_size=1
-    )
-    
     return {
         'id': draw(st.integers(min_value=1, max_value=300)),
-        'name': draw(safe_text.filter(lambda x: len(x) <= 20)),
+        'name': draw(SAFE_NAME),
         'is_main_series': draw(st.booleans()),
         'effect_entries': draw(st.lists(
             st.fixed_dictionaries({
-                'effect': safe_text.filter(lambda x: len(x) <= 100),
-                'short_effect': safe_text.filter(lambda x: len(x) <= 50),
+                'effect': SAFE_EFFECT,
+                'short_effect': SAFE_SHORT_EFFECT,
                 'language': st.fixed_dictionaries({
-                    'name': safe_text.filter(lambda x: len(x) <= 10),
-                    'url': safe_text.filter(lambda x: len(x) <= 50)
+                    'name': SAFE_LANGUAGE_NAME,
+                    'url': SAFE_URL
                 })
             }),
             min_size=1,
@@ -113,17 +163,115 @@ def ability_response(draw):
     }
 
 
-# Property 3: API responses are stored in database
-@given(
-    endpoint=st.sampled_from(['pokemon', 'type', 'ability']),
-    resource_id=st.integers(min_value=1, max_value=1000),
-    response_data=st.one_of(pokemon_response(), type_response(), ability_response())
+# Frozen corpus of storage examples, generated once and kept in the pytest
+# cache so later runs replay it without paying for Hypothesis generation
+CORPUS_SIZE = 100
+
+# Markers around the strategy definitions hashed into the corpus cache key
+STRATEGIES_START = '# Shared text strategies'
+STRATEGIES_END = '# Frozen corpus of storage examples'
+
+
+def corpus_cache_key() -> str:
+    """
+    Derive the corpus cache key from the strategy definitions.
+    
+    Hypothesis builds composite strategies from generated code, so their
+    source is not available through inspect; the key hashes this module's
+    source from the shared text strategies down to the corpus section
+    instead, so changing any strategy (or CORPUS_SIZE) regenerates the
+    corpus without a manual version bump.
+    
+    Returns:
+        pytest cache key for the storage corpus
+    """
+    source = inspect.getsource(sys.modules[__name__])
+    start = source.index(STRATEGIES_START)
+    definition = source[start:source.index(STRATEGIES_END, start)] + str(CORPUS_SIZE)
+    return f"storage/corpus/{hashlib.sha256(definition.encode()).hexdigest()[:16]}"
+
+
+def generate_storage_corpus(size: int = CORPUS_SIZE) -> list:
+    """
+    Draw (endpoint, resource_id, response_data) examples with Hypothesis.
+    
+    Generation is derandomized so every xdist worker builds the same corpus
+    and collects the same parametrized tests.
+    
+    Args:
+        size: Number of examples to draw
+        
+    Returns:
+        List of [endpoint, resource_id, response_data] entries
+    """
+    corpus = []
+    
+    @given(
+        endpoint=st.sampled_from(['pokemon', 'type', 'ability']),
+        resource_id=st.integers(min_value=1, max_value=1000),
+        response_data=st.one_of(pokemon_response(), type_response(), ability_response())
+    )
+    @settings(
+        max_examples=size,
+        derandomize=True,
+        database=None,
+        phases=[Phase.generate]
+    )
+    def collect(endpoint, resource_id, response_data):
+        corpus.append([endpoint, resource_id, response_data])
+    
+    collect()
+    return corpus
+
+
+def load_storage_corpus(config) -> list:
+    """
+    Load the storage corpus from the pytest cache, generating it on first use.
+    
+    Args:
+        config: pytest config (its cache is absent with -p no:cacheprovider)
+        
+    Returns:
+        List of [endpoint, resource_id, response_data] entries
+    """
+    cache = getattr(config, "cache", None)
+    key = corpus_cache_key()
+    
+    corpus = cache.get(key, None) if cache is not None else None
+    if corpus is None:
+        corpus = generate_storage_corpus()
+        if cache is not None:
+            cache.set(key, corpus)
+    
+    return corpus
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize corpus-driven tests from the cached storage corpus."""
+    if "corpus_entry" in metafunc.fixturenames:
+        metafunc.parametrize("corpus_entry", load_storage_corpus(metafunc.config))
+
+
+# Property 3: API responses are stored in database (live generation, for
+# exploring new inputs; regular runs use the corpus test below)
+# Endpoint and resource ID are discrete axes with nothing for Hypothesis to
+# search or shrink, so they are parametrized; only response_data is drawn.
+# The example budget is split across the parametrized cases.
+STORAGE_ENDPOINTS = ['pokemon', 'type', 'ability']
+STORAGE_RESOURCE_IDS = [1, 500, 1000]
+STORAGE_EXAMPLES_PER_CASE = max(
+    1, DB_SETTINGS.max_examples // (len(STORAGE_ENDPOINTS) * len(STORAGE_RESOURCE_IDS))
 )
-@settings(
-    max_examples=100,
-    deadline=None,
-    suppress_health_check=[HealthCheck.function_scoped_fixture]
+
+
+@pytest.mark.skipif(
+    not EXPLORE,
+    reason="Live generation is opt-in (HYPOTHESIS_EXPLORE=1); the corpus test covers regular runs"
 )
+@pytest.mark.parametrize("endpoint", STORAGE_ENDPOINTS)
+@pytest.mark.parametrize("resource_id", STORAGE_RESOURCE_IDS)
+@given(response_data=st.one_of(pokemon_response(), type_response(), ability_response()))
+@settings(DB_SETTINGS, max_examples=STORAGE_EXAMPLES_PER_CASE)
 @pytest.mark.property
 def test_property_3_responses_stored_in_database(clean_db, endpoint, resource_id, response_data):
     """
@@ -139,17 +287,76 @@ def test_property_3_responses_stored_in_database(clean_db, endpoint, resource_id
     record_id = clean_db.store_response(endpoint, resource_id, response_data)
     
     # Verify the record was created
-    assert record_id is not None
-    assert isinstance(record_id, int)
-    assert record_id > 0
+    assert isinstance(record_id, int) and record_id > 0, f"Invalid record ID: {record_id!r}"
     
     # Retrieve the stored response
     stored = clean_db.get_latest_response(endpoint, resource_id)
     
     # Verify the response was stored correctly
     assert stored is not None, f"No response found for endpoint={endpoint}, resource_id={resource_id}"
-    assert stored['endpoint'] == endpoint, f"Expected endpoint '{endpoint}', got '{stored['endpoint']}'"
-    assert stored['resource_id'] == resource_id, f"Expected resource_id {resource_id}, got {stored['resource_id']}"
-    assert stored['response_data'] == response_data, "Stored response data does not match original"
-    assert 'created_at' in stored, "Timestamp not stored with response"
-    assert stored['created_at'] is not None, "Timestamp is None"
+    assert (stored.endpoint, stored.resource_id) == (endpoint, resource_id)
+    assert canonical_json(stored.response_data) == canonical_json(response_data), \
+        "Stored response data does not match original"
+    assert stored.created_at is not None, "Timestamp not stored with response"
+
+
+# Property 3 (corpus): replay the frozen corpus without Hypothesis generation
+@pytest.mark.property
+def test_property_3_corpus_responses_stored_in_database(clean_db, corpus_entry):
+    """
+    Feature: pokeapi-observability-tests, Property 3: API responses are stored in database
+    
+    For every response in the frozen storage corpus, the complete JSON response
+    shall be stored in PostgreSQL with endpoint name, resource ID, and timestamp.
+    
+    Validates: Requirements 5.1, 5.2, 5.3
+    """
+    endpoint, resource_id, response_data = corpus_entry
+    
+    record_id = clean_db.store_response(endpoint, resource_id, response_data)
+    stored = clean_db.get_latest_response(endpoint, resource_id)
+    
+    assert stored is not None, f"No response found for endpoint={endpoint}, resource_id={resource_id}"
+    assert (stored.id, stored.endpoint, stored.resource_id) == (record_id, endpoint, resource_id)
+    assert canonical_json(stored.response_data) == canonical_json(response_data), \
+        "Stored response data does not match original"
+    assert stored.created_at is not None, "Timestamp is None"
+
+
+# Property 3 (batched): responses stored in bulk are retrievable in one query
+@given(
+    rows=st.lists(
+        st.tuples(
+            st.sampled_from(['pokemon', 'type', 'ability']),
+            st.integers(min_value=1, max_value=1000),
+            st.one_of(pokemon_response(), type_response(), ability_response())
+        ),
+        min_size=1,
+        max_size=20
+    )
+)
+@settings(DB_SETTINGS, max_examples=25)
+@pytest.mark.property
+def test_property_3_bulk_responses_stored_in_database(clean_db, rows):
+    """
+    Feature: pokeapi-observability-tests, Property 3: API responses are stored in database
+    
+    For any batch of API responses, storing them in bulk shall persist every
+    response with its endpoint name and resource ID, using one round-trip
+    to insert and one to verify.
+    
+    Validates: Requirements 5.1, 5.2, 5.3
+    """
+    record_ids = clean_db.store_responses_bulk(rows)
+    
+    assert len(record_ids) == len(rows)
+    
+    stored = {row.id: row for row in clean_db.get_responses_by_ids(record_ids)}
+    
+    assert len(stored) == len(rows), "Not all responses were stored"
+    for record_id, (endpoint, resource_id, response_data) in zip(record_ids, rows):
+        row = stored[record_id]
+        assert row.endpoint == endpoint
+        assert row.resource_id == resource_id
+        assert canonical_json(row.response_data) == canonical_json(response_data)
+        assert row.created_at is not None
@@ -0,0 +1,24 @@
+"""
+Smoke tests for the shared PokéAPI client connection.
+
+These tests hit the live PokéAPI and are skipped unless
+POKEAPI_LIVE_TESTS=1 is set.
+"""
+
+import os
+import pytest
+from tests.api.endpoints import get_pokemon_url
+
+
+@pytest.mark.smoke
+@pytest.mark.skipif(
+    os.getenv('POKEAPI_LIVE_TESTS') != '1',
+    reason="Requires network access to PokéAPI"
+)
+@pytest.mark.asyncio
+async def test_session_client_uses_http2(api_client):
+    """Test that the session client negotiates HTTP/2 with PokéAPI."""
+    response = await api_client.client.get(get_pokemon_url(1))
+    
+    assert response.status_code == 200
+    assert response.http_version == "HTTP/2"
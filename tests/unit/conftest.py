@@ -0,0 +1,16 @@
+"""
+Pytest fixtures for unit tests.
+"""
+
+import pytest
+from tests.utils.schema_tracker import SchemaTracker
+
+
+@pytest.fixture
+def tracker():
+    """
+    Provide a fresh SchemaTracker instance.
+    Function-scoped since the tracker caches extracted schemas and
+    specialized extractors, which must not leak between tests.
+    """
+    return SchemaTracker()
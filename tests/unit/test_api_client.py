@@ -4,191 +4,332 @@ Unit tests for the PokéAPI client.
 Tests the HTTPX-based API client with resilience patterns.
 """
 
+import asyncio
+import sys
 import pytest
+import pytest_asyncio
 import httpx
-from unittest.mock import Mock, AsyncMock, patch
-from tests.api.client import PokeAPIClient
+import orjson
+from unittest.mock import patch
+from tests.api.client import PokeAPIClient, get_shared_client
+from tests.models.pokemon import Pokemon, parse_pokemon
 from tests.utils.rate_limiter import RateLimiter
 from tests.utils.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
 
 
+# Response bodies served by the mock transport, keyed by request path
+ROUTES = {
+    '/api/v2/pokemon/1': {
+        'id': 1,
+        'name': 'bulbasaur',
+        'types': [],
+        'abilities': [],
+        'stats': [],
+        'sprites': {},
+        'height': 7,
+        'weight': 69
+    },
+    '/api/v2/type/1': {
+        'id': 1,
+        'name': 'normal',
+        'damage_relations': {},
+        'pokemon': [],
+        'moves': []
+    },
+    '/api/v2/ability/1': {
+        'id': 1,
+        'name': 'stench',
+        'is_main_series': True,
+        'effect_entries': [],
+        'pokemon': []
+    },
+}
+
+
+# Bodies and headers are serialized once; each request only wraps them in
+# a fresh httpx.Response (responses are bound to their request, so the
+# objects themselves are not shared)
+JSON_HEADERS = {'Content-Type': 'application/json'}
+ROUTE_BODIES = {path: orjson.dumps(body) for path, body in ROUTES.items()}
+NOT_FOUND_BODY = orjson.dumps({'detail': 'Not found.'})
+RATE_LIMITED_HEADERS = {'Retry-After': '0'}
+
+
+def route(request: httpx.Request) -> httpx.Response:
+    """Serve ROUTES by path, and 404 for anything else."""
+    body = ROUTE_BODIES.get(request.url.path)
+    if body is None:
+        return httpx.Response(404, content=NOT_FOUND_BODY, headers=JSON_HEADERS)
+    return httpx.Response(200, content=body, headers=JSON_HEADERS)
+
+
+async def no_sleep(delay: float) -> None:
+    """Stand-in for asyncio.sleep that skips retry backoff without a Mock."""
+
+
+@pytest_asyncio.fixture
+async def client():
+    """PokeAPIClient with default settings, closed even if the test fails."""
+    async with PokeAPIClient() as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="module")
+async def mock_client():
+    """PokeAPIClient backed by a MockTransport, built once for the module."""
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(route))
+    client = PokeAPIClient(client=http_client, owns_client=True)
+    yield client
+    await client.close()
+
+
 @pytest.mark.asyncio
-async def test_client_initialization():
+async def test_client_initialization(client):
     """Test that client initializes with correct defaults."""
-    client = PokeAPIClient()
-    
     assert client.base_url == "https://pokeapi.co/api/v2"
     assert client.timeout == 10.0
     assert client.max_retries == 3
     assert 'pokemon' in client.circuit_breakers
     assert 'type' in client.circuit_breakers
     assert 'ability' in client.circuit_breakers
-    
-    await client.close()
 
 
 @pytest.mark.asyncio
 async def test_client_context_manager():
     """Test that client works as async context manager."""
-    async with PokeAPIClient() as client:
+    async with PokeAPIClient(client=httpx.AsyncClient(), owns_client=True) as client:
         assert client.client is not None
     
-    # Client should be closed after context exit
+    # Owned client should be closed after context exit
     assert client.client.is_closed
 
 
 @pytest.mark.asyncio
-async def test_get_pokemon_success():
+async def test_shared_client_reused():
+    """Test that clients without an injected client share one connection pool."""
+    first = PokeAPIClient()
+    second = PokeAPIClient()
+    
+    assert first.client is second.client
+    assert first.client is get_shared_client()
+    
+    # Closing a non-owning client must not close the shared client
+    async with first:
+        pass
+    assert not second.client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_shared_client_honours_instance_timeout():
+    """Test that each instance's timeout applies even on a shared client."""
+    timeouts = []
+    
+    def record_timeout(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions['timeout'])
+        return route(request)
+    
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(record_timeout))
+    fast = PokeAPIClient(timeout=1.5, client=http_client)
+    slow = PokeAPIClient(timeout=20.0, client=http_client)
+    
+    await fast.get_pokemon(1)
+    await slow.get_pokemon(1)
+    await http_client.aclose()
+    
+    assert [timeout['read'] for timeout in timeouts] == [1.5, 20.0]
+
+
+@pytest.mark.asyncio
+async def test_get_pokemon_success(mock_client):
     """Test successful pokemon request."""
-    mock_response = {
+    result = await mock_client.get_pokemon(1)
+    
+    assert result == ROUTES['/api/v2/pokemon/1']
+
+
+@pytest.mark.asyncio
+async def test_get_type_success(mock_client):
+    """Test successful type request."""
+    result = await mock_client.get_type(1)
+    
+    assert result == ROUTES['/api/v2/type/1']
+
+
+@pytest.mark.asyncio
+async def test_get_ability_success(mock_client):
+    """Test successful ability request."""
+    result = await mock_client.get_ability(1)
+    
+    assert result == ROUTES['/api/v2/ability/1']
+
+
+@pytest.mark.asyncio
+async def test_get_pokemon_model_validates_raw_body():
+    """Test that model getters validate the response body into a model."""
+    body = {
         'id': 1,
         'name': 'bulbasaur',
-        'types': [],
-        'abilities': [],
-        'stats': [],
-        'sprites': {},
         'height': 7,
-        'weight': 69
+        'weight': 69,
+        'types': [{'slot': 1, 'type': {'name': 'grass', 'url': 'u'}}],
+        'abilities': [{'is_hidden': False, 'slot': 1, 'ability': {'name': 'overgrow', 'url': 'u'}}],
+        'stats': [{'base_stat': 45, 'effort': 0, 'stat': {'name': 'hp', 'url': 'u'}}],
+        'sprites': {},
     }
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=orjson.dumps(body), headers=JSON_HEADERS)
+        )
+    )
     
-    client = PokeAPIClient()
+    async with PokeAPIClient(client=http_client, owns_client=True) as client:
+        pokemon = await client.get_pokemon_model(1)
     
-    with patch.object(client.client, 'get', new_callable=AsyncMock) as mock_get:
-        mock_http_response = Mock()
-        mock_http_response.status_code = 200
-        mock_http_response.json.return_value = mock_response
-        mock_http_response.raise_for_status = Mock()
-        mock_get.return_value = mock_http_response
-        
-        result = await client.get_pokemon(1)
-        
-        assert result == mock_response
-        assert mock_get.called
+    assert isinstance(pokemon, Pokemon)
+    assert pokemon.name == 'bulbasaur'
+    assert pokemon.types[0].type.name == 'grass'
     
-    await client.close()
+    # Identical bodies must not share a model whose lists a test could mutate
+    pokemon.types.clear()
+    assert parse_pokemon(orjson.dumps(body)).types[0].type.name == 'grass'
 
 
 @pytest.mark.asyncio
-async def test_get_type_success():
-    """Test successful type request."""
-    mock_response = {
-        'id': 1,
-        'name': 'normal',
-        'damage_relations': {},
-        'pokemon': [],
-        'moves': []
-    }
+async def test_rate_limiter_integration():
+    """Test that rate limiter is called when configured."""
+    # Long window so refill during the test is negligible
+    rate_limiter = RateLimiter(max_requests=10, time_window=3600)
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(route))
     
-    client = PokeAPIClient()
+    async with PokeAPIClient(
+        client=http_client, owns_client=True, rate_limiter=rate_limiter
+    ) as client:
+        await client.get_pokemon(1)
     
-    with patch.object(client.client, 'get', new_callable=AsyncMock) as mock_get:
-        mock_http_response = Mock()
-        mock_http_response.status_code = 200
-        mock_http_response.json.return_value = mock_response
-        mock_http_response.raise_for_status = Mock()
-        mock_get.return_value = mock_http_response
-        
-        result = await client.get_type(1)
-        
-        assert result == mock_response
-        assert mock_get.called
+    # One token consumed
+    assert int(rate_limiter.tokens) == 9
+
+
+@pytest.mark.asyncio
+async def test_http_error_handling(mock_client):
+    """Test that HTTP errors are properly handled."""
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await mock_client.get_pokemon(99999)
     
-    await client.close()
+    assert exc_info.value.response.status_code == 404
 
 
 @pytest.mark.asyncio
-async def test_get_ability_success():
-    """Test successful ability request."""
-    mock_response = {
-        'id': 1,
-        'name': 'stench',
-        'is_main_series': True,
-        'effect_entries': [],
-        'pokemon': []
-    }
+async def test_rate_limited_request_retried_once_per_attempt():
+    """Test that a 429 is retried in the same loop without double-counting."""
+    # Long window so refill during the test is negligible
+    rate_limiter = RateLimiter(max_requests=10, time_window=3600)
+    requests = []
     
-    client = PokeAPIClient()
+    def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(429, headers=RATE_LIMITED_HEADERS)
+        return route(request)
     
-    with patch.object(client.client, 'get', new_callable=AsyncMock) as mock_get:
-        mock_http_response = Mock()
-        mock_http_response.status_code = 200
-        mock_http_response.json.return_value = mock_response
-        mock_http_response.raise_for_status = Mock()
-        mock_get.return_value = mock_http_response
-        
-        result = await client.get_ability(1)
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    with patch('tests.api.client.asyncio.sleep', no_sleep):
+        async with PokeAPIClient(
+            client=http_client, owns_client=True, rate_limiter=rate_limiter
+        ) as client:
+            result = await client.get_pokemon(1)
+    
+    assert result == ROUTES['/api/v2/pokemon/1']
+    assert len(requests) == 2
+    # One token per attempt
+    assert int(rate_limiter.tokens) == 8
+
+
+@pytest.mark.asyncio
+async def test_sustained_rate_limiting_does_not_recurse():
+    """Test that repeated 429s are retried without nesting request calls."""
+    depths = []
+    
+    def handler(request):
+        frame = sys._getframe()
+        depth = 0
+        while frame is not None:
+            if frame.f_code.co_name == '_make_request_bytes':
+                depth += 1
+            frame = frame.f_back
+        depths.append(depth)
         
-        assert result == mock_response
-        assert mock_get.called
+        if len(depths) <= 3:
+            return httpx.Response(429, headers=RATE_LIMITED_HEADERS)
+        return route(request)
     
-    await client.close()
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    with patch('tests.api.client.asyncio.sleep', no_sleep):
+        async with PokeAPIClient(client=http_client, owns_client=True) as client:
+            result = await client.get_pokemon(1)
+    
+    assert result['name'] == 'bulbasaur'
+    assert depths == [1, 1, 1, 1]
 
 
 @pytest.mark.asyncio
-async def test_rate_limiter_integration():
-    """Test that rate limiter is called when configured."""
-    rate_limiter = RateLimiter(max_requests=10, time_window=60)
-    client = PokeAPIClient(rate_limiter=rate_limiter)
+async def test_server_error_retries_bounded():
+    """Test that 5xx errors are retried at most max_retries times."""
+    requests = []
     
-    mock_response = {'id': 1, 'name': 'bulbasaur'}
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503)
     
-    with patch.object(client.client, 'get', new_callable=AsyncMock) as mock_get:
-        mock_http_response = Mock()
-        mock_http_response.status_code = 200
-        mock_http_response.json.return_value = mock_response
-        mock_http_response.raise_for_status = Mock()
-        mock_get.return_value = mock_http_response
-        
-        with patch.object(rate_limiter, 'acquire', new_callable=AsyncMock) as mock_acquire:
-            await client.get_pokemon(1)
-            assert mock_acquire.called
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
     
-    await client.close()
+    with patch('tests.api.client.asyncio.sleep', no_sleep):
+        async with PokeAPIClient(client=http_client, owns_client=True, max_retries=2) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_pokemon(1)
+    
+    assert len(requests) == 3
 
 
 @pytest.mark.asyncio
-async def test_http_error_handling():
-    """Test that HTTP errors are properly handled."""
-    client = PokeAPIClient()
-    
-    with patch.object(client.client, 'get', new_callable=AsyncMock) as mock_get:
-        mock_http_response = Mock()
-        mock_http_response.status_code = 404
-        mock_http_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Not found",
-            request=Mock(),
-            response=mock_http_response
-        )
-        mock_get.return_value = mock_http_response
-        
-        with pytest.raises(httpx.HTTPStatusError):
-            await client.get_pokemon(99999)
+async def test_get_many_preserves_order_and_bounds_concurrency(client):
+    """Test that get_many returns results in order with bounded concurrency."""
+    in_flight = 0
+    max_in_flight = 0
     
-    await client.close()
+    async def fake_getter(resource_id):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {'id': resource_id}
+    
+    results = await client.get_many(fake_getter, range(1, 11), concurrency=3)
+    
+    assert [r['id'] for r in results] == list(range(1, 11))
+    assert max_in_flight <= 3
 
 
 @pytest.mark.asyncio
-async def test_circuit_breaker_state():
+async def test_circuit_breaker_state(client):
     """Test circuit breaker state retrieval."""
-    client = PokeAPIClient()
-    
     # Initially closed
     assert client.get_circuit_breaker_state('pokemon') == 0
-    
-    await client.close()
 
 
 @pytest.mark.asyncio
-async def test_jitter_adds_randomness():
-    """Test that jitter adds random delay."""
-    client = PokeAPIClient()
-    
-    delays = [client._add_jitter(1.0) for _ in range(10)]
+async def test_full_jitter_spans_backoff_window(client):
+    """Test that full jitter draws delays across the whole backoff window."""
+    delays = [client._full_jitter(3) for _ in range(50)]
     
-    # All delays should be between 1.0 and 2.0
-    assert all(1.0 <= d <= 2.0 for d in delays)
+    # All delays should be between 0 and 2^3 seconds
+    assert all(0.0 <= d <= 8.0 for d in delays)
     
     # Delays should not all be the same (randomness)
     assert len(set(delays)) > 1
     
-    await client.close()
+    # Large attempts are capped at max_backoff
+    assert all(client._full_jitter(10) <= 30.0 for _ in range(10))
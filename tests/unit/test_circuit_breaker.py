@@ -0,0 +1,222 @@
+"""
+Unit tests for the circuit breaker.
+
+Tests state transitions between CLOSED, OPEN, and HALF_OPEN.
+"""
+
+import pytest
+from tests.utils.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError, CircuitState
+
+
+async def _fail(breaker: CircuitBreaker, times: int) -> None:
+    """Record the given number of failures."""
+    for _ in range(times):
+        await breaker.record_failure()
+
+
+@pytest.mark.asyncio
+async def test_opens_after_failure_threshold():
+    """Test that the circuit opens once the failure rate reaches the threshold."""
+    breaker = CircuitBreaker(failure_threshold=0.5, window_size=4)
+    
+    await breaker.record_success()
+    await breaker.record_success()
+    await _fail(breaker, 1)
+    assert not breaker.is_open()
+    
+    await _fail(breaker, 1)
+    assert breaker.is_open()
+    assert breaker.get_state_value() == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_count_tracks_window_eviction():
+    """Test that failures leaving the sliding window no longer count."""
+    breaker = CircuitBreaker(failure_threshold=0.5, window_size=4, window_duration=60.0)
+    await _fail(breaker, 2)
+    assert breaker._failures_in_window == 2
+    
+    # Age the recorded failures out of the window
+    for i in range(len(breaker._ts)):
+        breaker._ts[i] -= 120 * 1_000_000_000
+    for _ in range(3):
+        await breaker.record_success()
+    await _fail(breaker, 1)
+    
+    assert breaker._failures_in_window == 1
+    assert breaker._calculate_failure_rate() == 0.25
+    assert breaker.get_state() == CircuitState.CLOSED
+    assert breaker._window_len() == 4
+    assert [success for _, success in breaker.request_history] == [True, True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_evicted_history_is_compacted():
+    """Test that evicted entries are dropped once they outnumber live ones."""
+    breaker = CircuitBreaker(window_size=100, window_duration=60.0)
+    await _fail(breaker, 3)
+    for i in range(len(breaker._ts)):
+        breaker._ts[i] -= 120 * 1_000_000_000
+    
+    await _fail(breaker, 1)
+    
+    assert breaker._head == 0
+    assert len(breaker._ts) == len(breaker._ok) == 1
+    assert breaker._failures_in_window == 1
+
+
+@pytest.mark.asyncio
+async def test_window_capped_at_max_rps():
+    """Test that the window never exceeds max_rps * window_duration entries."""
+    breaker = CircuitBreaker(window_size=10, window_duration=2.0, max_rps=2)
+    await _fail(breaker, 1)
+    for _ in range(10):
+        await breaker.record_success()
+    
+    assert breaker._window_len() == 4
+    assert breaker._failures_in_window == 0
+    assert len(breaker._ts) <= 8
+
+
+@pytest.mark.asyncio
+async def test_opens_exactly_at_fractional_threshold():
+    """Test that a threshold not exact in binary still opens at the boundary."""
+    breaker = CircuitBreaker(failure_threshold=0.29, window_size=100)
+    for _ in range(71):
+        await breaker.record_success()
+    
+    await _fail(breaker, 28)
+    assert breaker.get_state() == CircuitState.CLOSED
+    
+    await _fail(breaker, 1)
+    assert breaker.get_state() == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_stays_closed_below_window_size():
+    """Test that failures are not evaluated before window_size requests."""
+    breaker = CircuitBreaker(window_size=10)
+    
+    await _fail(breaker, 9)
+    
+    assert breaker.get_state() == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_is_open_enters_half_open_after_timeout():
+    """Test that is_open moves an expired open circuit to half-open."""
+    breaker = CircuitBreaker(window_size=1, timeout=0.0)
+    
+    await _fail(breaker, 1)
+    
+    assert not breaker.is_open()
+    assert breaker.get_state() == CircuitState.HALF_OPEN
+
+
+@pytest.mark.asyncio
+async def test_half_open_closes_after_successes():
+    """Test that enough successes in half-open state close the circuit."""
+    breaker = CircuitBreaker(window_size=1, timeout=0.0, success_threshold=2)
+    await _fail(breaker, 1)
+    breaker.is_open()
+    
+    await breaker.record_success()
+    assert breaker.get_state() == CircuitState.HALF_OPEN
+    
+    await breaker.record_success()
+    assert breaker.get_state() == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_half_open_failure_reopens():
+    """Test that a failure in half-open state reopens the circuit."""
+    breaker = CircuitBreaker(window_size=1, timeout=0.0)
+    await _fail(breaker, 1)
+    breaker.is_open()
+    
+    await _fail(breaker, 1)
+    
+    assert breaker.get_state() == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_half_open_deadline_follows_reopen():
+    """Test that reopening restarts the timeout and reset clears it."""
+    breaker = CircuitBreaker(window_size=1, timeout=30.0)
+    await _fail(breaker, 1)
+    assert breaker._half_open_deadline_ns == breaker.opened_at + 30 * 1_000_000_000
+    
+    # Expire the timeout, then fail the half-open probe
+    breaker._half_open_deadline_ns = 0
+    assert not breaker.is_open()
+    await _fail(breaker, 1)
+    
+    assert breaker.is_open()
+    assert breaker._half_open_deadline_ns == breaker.opened_at + 30 * 1_000_000_000
+    
+    breaker.reset()
+    assert breaker._half_open_deadline_ns == 0
+
+
+@pytest.mark.asyncio
+async def test_call_rejects_when_open():
+    """Test that call() fails fast while the circuit is open."""
+    breaker = CircuitBreaker(window_size=1, timeout=30.0)
+    await _fail(breaker, 1)
+    
+    async def request():
+        return 'ok'
+    
+    with pytest.raises(CircuitBreakerOpenError):
+        await breaker.call(request)
+
+
+@pytest.mark.asyncio
+async def test_rejections_reuse_one_error():
+    """Test that rejected calls raise the same error without growing its traceback."""
+    breaker = CircuitBreaker(window_size=1, timeout=30.0, name='pokemon')
+    await _fail(breaker, 1)
+    
+    async def request():
+        return 'ok'
+    
+    errors, depths = [], []
+    for _ in range(3):
+        with pytest.raises(CircuitBreakerOpenError) as exc_info:
+            await breaker.call(request)
+        errors.append(exc_info.value)
+        depths.append(len(exc_info.traceback))
+    
+    assert errors[0] is errors[1] is errors[2]
+    assert depths[0] == depths[1] == depths[2]
+    assert str(errors[0]) == "Circuit breaker is open for endpoint: pokemon"
+
+
+@pytest.mark.asyncio
+async def test_call_records_outcomes_when_closed():
+    """Test that call() runs the function and records its outcome."""
+    breaker = CircuitBreaker(window_size=10)
+    
+    async def request():
+        return 'ok'
+    
+    async def failing_request():
+        raise ValueError("boom")
+    
+    assert await breaker.call(request) == 'ok'
+    with pytest.raises(ValueError):
+        await breaker.call(failing_request)
+    
+    assert [success for _, success in breaker.request_history] == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_reset_clears_state():
+    """Test that reset returns the circuit to closed with no history."""
+    breaker = CircuitBreaker(window_size=1)
+    await _fail(breaker, 1)
+    
+    breaker.reset()
+    
+    assert breaker.get_state() == CircuitState.CLOSED
+    assert not breaker.is_open()
@@ -0,0 +1,55 @@
+"""
+Unit tests for the token bucket rate limiter.
+
+Tests token consumption, FIFO waiting, and cancellation.
+"""
+
+import asyncio
+import pytest
+from tests.utils.rate_limiter import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_acquire_consumes_tokens_without_waiting():
+    """Test that acquire takes tokens immediately while the bucket has them."""
+    limiter = RateLimiter(max_requests=3, time_window=3600)
+    
+    for _ in range(3):
+        await limiter.acquire()
+    
+    assert int(limiter.tokens) == 0
+    assert not limiter._waiters
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_granted_in_fifo_order():
+    """Test that callers waiting on an empty bucket are served in arrival order."""
+    limiter = RateLimiter(max_requests=1, time_window=0.02)
+    await limiter.acquire()
+    order = []
+    
+    async def worker(n):
+        await limiter.acquire()
+        order.append(n)
+    
+    await asyncio.wait_for(asyncio.gather(*(worker(n) for n in range(5))), timeout=5)
+    
+    assert order == [0, 1, 2, 3, 4]
+    assert not limiter._waiters
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_consume_token():
+    """Test that a cancelled acquire leaves its place to the next waiter."""
+    limiter = RateLimiter(max_requests=1, time_window=0.05)
+    await limiter.acquire()
+    
+    cancelled = asyncio.ensure_future(limiter.acquire())
+    waiting = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    
+    await asyncio.wait_for(waiting, timeout=5)
+    
+    assert cancelled.cancelled()
+    assert not limiter._waiters
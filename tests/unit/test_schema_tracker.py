@@ -3,7 +3,14 @@ Unit tests for schema tracking functionality.
 Tests schema extraction and comparison logic.
 """
 
+import sys
+import uuid
+from collections import OrderedDict
+from hashlib import blake2b
+from enum import IntEnum
+import orjson
 import pytest
+from tests.utils import schema_tracker
 from tests.utils.schema_tracker import (
     SchemaTracker,
     SchemaDiff,
@@ -15,9 +22,8 @@ from tests.utils.schema_tracker import (
 class TestSchemaExtraction:
     """Tests for extract_schema_structure method."""
     
-    def test_extract_simple_types(self):
+    def test_extract_simple_types(self, tracker):
         """Test extraction of simple data types."""
-        tracker = SchemaTracker()
         response = {
             "id": 1,
             "name": "bulbasaur",
@@ -34,9 +40,8 @@ class TestSchemaExtraction:
         assert schema["is_default"] == "bool"
         assert schema["description"] == "null"
     
-    def test_extract_nested_dict(self):
+    def test_extract_nested_dict(self, tracker):
         """Test extraction of nested dictionary structures."""
-        tracker = SchemaTracker()
         response = {
             "id": 1,
             "sprites": {
@@ -52,9 +57,8 @@ class TestSchemaExtraction:
         assert schema["sprites.front_default"] == "str"
         assert schema["sprites.back_default"] == "str"
     
-    def test_extract_list_with_items(self):
+    def test_extract_list_with_items(self, tracker):
         """Test extraction of list structures with items."""
-        tracker = SchemaTracker()
         response = {
             "id": 1,
             "types": [
@@ -71,9 +75,8 @@ class TestSchemaExtraction:
         assert schema["types[].type"] == "dict"
         assert schema["types[].type.name"] == "str"
     
-    def test_extract_empty_list(self):
+    def test_extract_empty_list(self, tracker):
         """Test extraction of empty list."""
-        tracker = SchemaTracker()
         response = {
             "id": 1,
             "moves": []
@@ -86,9 +89,8 @@ class TestSchemaExtraction:
         # Empty list should not have item schema
         assert "moves[]" not in schema
     
-    def test_extract_deeply_nested(self):
+    def test_extract_deeply_nested(self, tracker):
         """Test extraction of deeply nested structures."""
-        tracker = SchemaTracker()
         response = {
             "level1": {
                 "level2": {
@@ -106,19 +108,131 @@ class TestSchemaExtraction:
         assert schema["level1.level2.level3"] == "dict"
         assert schema["level1.level2.level3.value"] == "int"
     
-    def test_extract_empty_dict(self):
+    def test_extract_nesting_deeper_than_recursion_limit(self, tracker):
+        """Test that extraction does not recurse per nesting level."""
+        depth = sys.getrecursionlimit() + 100
+        response = {"value": 1}
+        for _ in range(depth):
+            response = {"child": response}
+        
+        schema = tracker.extract_schema_structure(response)
+        
+        assert len(schema) == depth + 1
+        assert schema[".".join(["child"] * depth + ["value"])] == "int"
+    
+    def test_extract_reuses_cached_schema(self, tracker):
+        """Test that equal raw bodies are walked once and get independent copies."""
+        raw = b'{"id": 1, "stats": [{"base_stat": 45}]}'
+        
+        first = tracker.extract_schema_structure(raw)
+        first["mutated"] = "str"
+        second = tracker.extract_schema_structure(raw)
+        
+        assert len(tracker._cache) == 1
+        assert second == {"id": "int", "stats": "list", "stats[].base_stat": "int"}
+        
+        tracker.clear_cache()
+        assert tracker._cache == {}
+    
+    def test_extract_cache_evicts_least_recently_used(self):
+        """Test that the schema cache stays bounded and keeps recent entries."""
+        tracker = SchemaTracker(cache_size=2)
+        
+        tracker.extract_schema_structure(b'{"a":1}')
+        tracker.extract_schema_structure(b'{"b":1}')
+        tracker.extract_schema_structure(b'{"a":1}')
+        tracker.extract_schema_structure(b'{"c":1}')
+        
+        assert len(tracker._cache) == 2
+        assert [key[1] for key in tracker._cache] == [
+            blake2b(body, digest_size=schema_tracker.BODY_DIGEST_SIZE).digest()
+            for body in (b'{"a":1}', b'{"c":1}')
+        ]
+    
+    @pytest.mark.parametrize("value, type_name", [
+        ((1, 2), "tuple"),
+        (uuid.UUID(int=1), "UUID"),
+        (float("nan"), "float"),
+        (object(), "object"),
+    ])
+    def test_extract_parsed_responses_not_cached(self, tracker, value, type_name):
+        """Test that parsed responses are walked as-is, whatever JSON they would serialize to."""
+        assert tracker.extract_schema_structure({"id": 1, "raw": value}) == {"id": "int", "raw": type_name}
+        assert tracker._cache == {}
+    
+    def test_extract_names_json_type_subclasses(self, tracker):
+        """Test that subclasses of JSON types are named after the type they extend."""
+        class Slot(IntEnum):
+            FIRST = 1
+        
+        response = {"slot": Slot.FIRST, "sprites": OrderedDict(front="url"), "raw": b"x"}
+        
+        schema = tracker.extract_schema_structure(response)
+        
+        assert schema == {"slot": "int", "sprites": "dict", "sprites.front": "str", "raw": "bytes"}
+    
+    def test_extract_shares_field_path_strings(self, tracker):
+        """Test that equal field paths from separate responses are the same object."""
+        first = tracker.extract_schema_structure({"stats": {"base_stat": 45}})
+        second = tracker.extract_schema_structure({"stats": {"base_stat": 49}})
+        
+        assert [a is b for a, b in zip(first, second)] == [True, True]
+        assert list(tracker.extract_schema_structure({1: "a"})) == ["1"]
+        assert list(tracker.extract_schema_structure({True: "a"})) == ["True"]
+    
+    def test_extract_shares_type_name_strings(self, tracker):
+        """Test that extracted type names are shared constants, not per-field strings."""
+        first = tracker.extract_schema_structure({"id": 1, "stats": {"base_stat": 45}})
+        second = tracker.extract_schema_structure({"weight": 69, "height": 7})
+        
+        assert first["id"] is first["stats.base_stat"] is second["weight"] is second["height"]
+    
+    def test_extract_path_cache_stays_bounded(self, tracker, monkeypatch):
+        """Test that cached field paths are capped per prefix and overall."""
+        monkeypatch.setattr(schema_tracker, "_PATH_CACHE", {})
+        monkeypatch.setattr(schema_tracker, "PATH_CACHE_KEYS", 2)
+        monkeypatch.setattr(schema_tracker, "PATH_CACHE_PREFIXES", 2)
+        
+        schema = tracker._walk({"a": 1, "b": 2, "c": {"d": {"e": 3}}}, "")
+        
+        assert schema == {"a": "int", "b": "int", "c": "dict", "c.d": "dict", "c.d.e": "int"}
+        assert len(schema_tracker._PATH_CACHE) <= 2
+        assert all(len(paths) <= 2 for paths in schema_tracker._PATH_CACHE.values())
+    
+    def test_extract_from_raw_json_bytes(self, tracker):
+        """Test that raw JSON bodies extract the same schema as parsed dicts."""
+        response = {"id": 1, "name": "bulbasaur", "types": [{"slot": 1}]}
+        raw = orjson.dumps(response)
+        
+        assert tracker.extract_schema_structure(raw) == tracker.extract_schema_structure(response)
+        assert tracker.extract_schema_structure(raw.decode()) == tracker.extract_schema_structure(raw)
+        assert tracker.extract_schema_structure(b"[1, 2]") == {}
+        
+        with pytest.raises(orjson.JSONDecodeError):
+            tracker.extract_schema_structure(b"{not json")
+    
+    def test_extract_preserves_depth_first_order(self, tracker):
+        """Test that nested fields follow their parent in document order."""
+        response = {
+            "a": {"b": 1},
+            "c": [{"d": "x"}],
+            "e": True
+        }
+        
+        schema = tracker.extract_schema_structure(response)
+        
+        assert list(schema) == ["a", "a.b", "c", "c[].d", "e"]
+    
+    def test_extract_empty_dict(self, tracker):
         """Test extraction from empty dictionary."""
-        tracker = SchemaTracker()
         response = {}
         
         schema = tracker.extract_schema_structure(response)
         
         assert schema == {}
     
-    def test_extract_none_response(self):
+    def test_extract_none_response(self, tracker):
         """Test extraction from None response."""
-        tracker = SchemaTracker()
-        
         schema = tracker.extract_schema_structure(None)
         
         assert schema == {}
@@ -127,9 +241,8 @@ class TestSchemaExtraction:
 class TestSchemaComparison:
     """Tests for compare_schemas method."""
     
-    def test_no_changes(self):
+    def test_no_changes(self, tracker):
         """Test comparison when schemas are identical."""
-        tracker = SchemaTracker()
         schema1 = {"id": "int", "name": "str"}
         schema2 = {"id": "int", "name": "str"}
         
@@ -140,9 +253,16 @@ class TestSchemaComparison:
         assert len(diff.removed_fields) == 0
         assert len(diff.modified_fields) == 0
     
-    def test_field_added(self):
+    def test_equal_schemas_skip_diff(self, tracker, monkeypatch):
+        """Test that identical or equal schemas return an empty diff without diffing."""
+        schema = {"id": "int", "name": "str"}
+        monkeypatch.setattr(SchemaDiff, "_from_raw", None)
+        
+        assert not tracker.compare_schemas(schema, schema).has_changes
+        assert not tracker.compare_schemas(schema, dict(reversed(schema.items()))).has_changes
+    
+    def test_field_added(self, tracker):
         """Test detection of added fields."""
-        tracker = SchemaTracker()
         previous = {"id": "int", "name": "str"}
         current = {"id": "int", "name": "str", "height": "int"}
         
@@ -155,9 +275,8 @@ class TestSchemaComparison:
         assert diff.added_fields[0].new_value == "int"
         assert diff.added_fields[0].old_value is None
     
-    def test_field_removed(self):
+    def test_field_removed(self, tracker):
         """Test detection of removed fields."""
-        tracker = SchemaTracker()
         previous = {"id": "int", "name": "str", "height": "int"}
         current = {"id": "int", "name": "str"}
         
@@ -170,9 +289,8 @@ class TestSchemaComparison:
         assert diff.removed_fields[0].old_value == "int"
         assert diff.removed_fields[0].new_value is None
     
-    def test_type_changed(self):
+    def test_type_changed(self, tracker):
         """Test detection of type changes."""
-        tracker = SchemaTracker()
         previous = {"id": "int", "name": "str", "height": "int"}
         current = {"id": "int", "name": "str", "height": "float"}
         
@@ -185,9 +303,8 @@ class TestSchemaComparison:
         assert diff.modified_fields[0].old_value == "int"
         assert diff.modified_fields[0].new_value == "float"
     
-    def test_multiple_changes(self):
+    def test_multiple_changes(self, tracker):
         """Test detection of multiple simultaneous changes."""
-        tracker = SchemaTracker()
         previous = {
             "id": "int",
             "name": "str",
@@ -217,9 +334,8 @@ class TestSchemaComparison:
         # Check modified field
         assert diff.modified_fields[0].field_path == "height"
     
-    def test_nested_field_changes(self):
+    def test_nested_field_changes(self, tracker):
         """Test detection of changes in nested fields."""
-        tracker = SchemaTracker()
         previous = {
             "id": "int",
             "sprites": "dict",
@@ -238,9 +354,59 @@ class TestSchemaComparison:
         assert len(diff.added_fields) == 1
         assert diff.added_fields[0].field_path == "sprites.back"
     
-    def test_all_changes_property(self):
+    def test_matching_fingerprints_skip_diff(self, tracker):
+        """Test that equal fingerprints short-circuit and differing ones still diff."""
+        current = {"id": "int", "name": "str"}
+        reordered = {"name": "str", "id": "int"}
+        changed = {"id": "int", "name": "int"}
+        
+        assert tracker.fingerprint(current) == tracker.fingerprint(reordered)
+        assert tracker.fingerprint(current) != tracker.fingerprint(changed)
+        
+        unchanged = tracker.compare_schemas(
+            current, reordered, tracker.fingerprint(current), tracker.fingerprint(reordered)
+        )
+        assert not unchanged.has_changes
+        
+        diff = tracker.compare_schemas(
+            current, changed, tracker.fingerprint(current), tracker.fingerprint(changed)
+        )
+        assert [change.field_path for change in diff.modified_fields] == ["name"]
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_compare_many_matches_compare_schemas(self, tracker, monkeypatch, workers):
+        """Test that batch comparison returns the same diffs, in order, serially or in workers."""
+        monkeypatch.setattr(SchemaTracker, "PARALLEL_MIN_PAIRS", 1)
+        pairs = [
+            ({"id": "int", "name": "str"}, {"id": "int", "name": "str"}),
+            ({"id": "int", "name": "str"}, {"id": "str"}),
+            ({"id": "int"}, {"id": "int", "stats": "list"}),
+        ]
+        
+        diffs = SchemaTracker.compare_many(pairs, workers=workers)
+        
+        assert diffs == [tracker.compare_schemas(current, previous) for current, previous in pairs]
+        assert not diffs[0].has_changes
+        assert str(diffs[1]) == "1 field(s) added, 1 field(s) modified"
+        assert [change.field_path for change in diffs[2].removed_fields] == ["stats"]
+    
+    def test_changes_materialized_on_first_read(self, tracker):
+        """Test that SchemaChange objects are only built when change lists are read."""
+        diff = tracker.compare_schemas({"id": "int", "name": "str"}, {"id": "str"})
+        
+        assert diff.has_changes
+        assert str(diff) == "1 field(s) added, 1 field(s) modified"
+        assert diff._raw
+        
+        assert diff.added_fields == [SchemaChange(ChangeType.FIELD_ADDED, "name", None, "str")]
+        assert not diff._raw
+        assert diff == SchemaDiff(
+            added_fields=[SchemaChange(ChangeType.FIELD_ADDED, "name", None, "str")],
+            modified_fields=[SchemaChange(ChangeType.TYPE_CHANGED, "id", "str", "int")]
+        )
+    
+    def test_all_changes_property(self, tracker):
         """Test the all_changes property returns combined list."""
-        tracker = SchemaTracker()
         previous = {"id": "int", "old": "str"}
         current = {"id": "str", "new": "int"}
         
@@ -254,6 +420,21 @@ class TestSchemaComparison:
         assert ChangeType.FIELD_ADDED in change_types
         assert ChangeType.FIELD_REMOVED in change_types
         assert ChangeType.TYPE_CHANGED in change_types
+    
+    def test_change_lists_are_independent_copies(self, tracker):
+        """Test that change lists group changes by kind and can't corrupt the diff."""
+        diff = tracker.compare_schemas(
+            {"a": "int", "b": "str", "z": "int"},
+            {"a": "str", "c": "int", "y": "bool"}
+        )
+        
+        assert [change.field_path for change in diff.all_changes] == ["b", "z", "c", "y", "a"]
+        assert diff.all_changes == diff.added_fields + diff.removed_fields + diff.modified_fields
+        
+        diff.added_fields.append(diff.all_changes[-1])
+        diff.all_changes.append(diff.all_changes[0])
+        assert str(diff) == "2 field(s) added, 2 field(s) removed, 1 field(s) modified"
+        assert len(diff.all_changes) == 5
 
 
 class TestSchemaDiff:
@@ -320,6 +501,15 @@ class TestSchemaDiff:
 class TestSchemaChange:
     """Tests for SchemaChange class."""
     
+    def test_changes_and_diffs_have_no_instance_dict(self):
+        """Test that SchemaChange and SchemaDiff store fields in slots."""
+        change = SchemaChange(ChangeType.FIELD_ADDED, "new_field", new_value="int")
+        diff = SchemaDiff(added_fields=[change])
+        
+        assert not hasattr(change, "__dict__")
+        assert not hasattr(diff, "__dict__")
+        assert diff.has_changes
+    
     def test_str_field_added(self):
         """Test string representation of added field."""
         change = SchemaChange(
@@ -361,9 +551,8 @@ class TestSchemaChange:
 class TestSchemaTrackerHelperMethods:
     """Tests for helper methods in SchemaTracker."""
     
-    def test_get_field_paths(self):
+    def test_get_field_paths(self, tracker):
         """Test getting all field paths from schema."""
-        tracker = SchemaTracker()
         schema = {
             "id": "int",
             "name": "str",
@@ -374,18 +563,16 @@ class TestSchemaTrackerHelperMethods:
         
         assert paths == {"id", "name", "nested.field"}
     
-    def test_get_field_type_exists(self):
+    def test_get_field_type_exists(self, tracker):
         """Test getting type of existing field."""
-        tracker = SchemaTracker()
         schema = {"id": "int", "name": "str"}
         
         field_type = tracker.get_field_type(schema, "id")
         
         assert field_type == "int"
     
-    def test_get_field_type_not_exists(self):
+    def test_get_field_type_not_exists(self, tracker):
         """Test getting type of non-existent field."""
-        tracker = SchemaTracker()
         schema = {"id": "int"}
         
         field_type = tracker.get_field_type(schema, "nonexistent")
@@ -393,12 +580,58 @@ class TestSchemaTrackerHelperMethods:
         assert field_type is None
 
 
+class TestSpecializedExtraction:
+    """Tests for extractors generated by specialize()."""
+    
+    EXAMPLE = {
+        "id": 1,
+        "name": "bulbasaur",
+        "sprites": {"front_default": "url", "back_female": None},
+        "types": [{"slot": 1, "type": {"name": "grass"}}],
+        "held_items": [],
+    }
+    
+    @pytest.mark.parametrize("response", [
+        EXAMPLE,
+        {**EXAMPLE, "id": 2, "name": "ivysaur"},
+        {**EXAMPLE, "id": "2"},
+        {**EXAMPLE, "weight": 130},
+        {k: v for k, v in EXAMPLE.items() if k != "name"},
+        {**EXAMPLE, "sprites": {"front_default": "url", "back_female": "url"}},
+        {**EXAMPLE, "types": []},
+        {**EXAMPLE, "held_items": [{"item": {"name": "berry"}}]},
+        {**EXAMPLE, "id": True},
+        None,
+    ])
+    def test_matches_generic_extraction(self, tracker, response):
+        """Test that specialized extraction returns the generic schema, matching or not."""
+        extract = tracker.specialize("pokemon", self.EXAMPLE)
+        
+        assert extract(response) == SchemaTracker().extract_schema_structure(response)
+    
+    def test_extractor_cached_per_endpoint(self, tracker):
+        """Test that an endpoint's extractor is generated once and returns copies."""
+        extract = tracker.specialize("pokemon", self.EXAMPLE)
+        
+        assert tracker.specialize("pokemon", {"other": 1}) is extract
+        assert tracker.specialize("ability", {"other": 1}) is not extract
+        
+        extract(self.EXAMPLE)["id"] = "str"
+        assert extract(self.EXAMPLE)["id"] == "int"
+    
+    def test_unsupported_example_uses_generic_extraction(self, tracker):
+        """Test that examples outside plain JSON types are not specialized."""
+        extract = tracker.specialize("pokemon", {"id": 1, 2: "two"})
+        
+        assert extract == tracker.extract_schema_structure
+        assert extract({"id": 1}) == {"id": "int"}
+
+
 class TestEndToEndScenarios:
     """End-to-end tests with realistic API response scenarios."""
     
-    def test_pokemon_response_extraction(self):
+    def test_pokemon_response_extraction(self, tracker):
         """Test extraction from realistic Pokemon API response."""
-        tracker = SchemaTracker()
         response = {
             "id": 1,
             "name": "bulbasaur",
@@ -441,10 +674,8 @@ class TestEndToEndScenarios:
         assert schema["abilities[].is_hidden"] == "bool"
         assert schema["abilities[].ability.name"] == "str"
     
-    def test_schema_evolution_scenario(self):
+    def test_schema_evolution_scenario(self, tracker):
         """Test detecting schema evolution over time."""
-        tracker = SchemaTracker()
-        
         # Version 1 of API
         v1_response = {
             "id": 1,
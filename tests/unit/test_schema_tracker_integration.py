@@ -4,19 +4,16 @@ Shows how schema tracker integrates with database repository.
 """
 
 import pytest
-from tests.utils.schema_tracker import SchemaTracker
 
 
 class TestSchemaTrackingWorkflow:
     """Integration tests for complete schema tracking workflow."""
     
-    def test_complete_workflow_with_schema_change(self):
+    def test_complete_workflow_with_schema_change(self, tracker):
         """
         Test complete workflow: extract schema, compare, detect changes.
         Validates Requirements 4.1 and 4.2.
         """
-        tracker = SchemaTracker()
-        
         # Simulate first API call - establish baseline
         first_response = {
             "id": 1,
@@ -63,10 +60,8 @@ class TestSchemaTrackingWorkflow:
         assert "1 field(s) added" in summary
         assert "1 field(s) modified" in summary
     
-    def test_workflow_no_changes(self):
+    def test_workflow_no_changes(self, tracker):
         """Test workflow when API schema hasn't changed."""
-        tracker = SchemaTracker()
-        
         response1 = {"id": 1, "name": "bulbasaur"}
         response2 = {"id": 2, "name": "ivysaur"}  # Different data, same schema
         
@@ -81,10 +76,8 @@ class TestSchemaTrackingWorkflow:
         assert len(diff.removed_fields) == 0
         assert len(diff.modified_fields) == 0
     
-    def test_workflow_with_nested_changes(self):
+    def test_workflow_with_nested_changes(self, tracker):
         """Test workflow detecting changes in nested structures."""
-        tracker = SchemaTracker()
-        
         # Original nested structure
         original = {
             "id": 1,
@@ -116,10 +109,8 @@ class TestSchemaTrackingWorkflow:
         assert "sprites.back_default" in added_paths
         assert "sprites.front_shiny" in added_paths
     
-    def test_workflow_with_list_structure_changes(self):
+    def test_workflow_with_list_structure_changes(self, tracker):
         """Test workflow detecting changes in list item structures."""
-        tracker = SchemaTracker()
-        
         # Original list structure
         original = {
             "types": [
@@ -149,10 +140,8 @@ class TestSchemaTrackingWorkflow:
         assert len(diff.added_fields) == 1
         assert diff.added_fields[0].field_path == "types[].type.url"
     
-    def test_change_details_for_logging(self):
+    def test_change_details_for_logging(self, tracker):
         """Test that change details are suitable for logging (Requirement 4.2)."""
-        tracker = SchemaTracker()
-        
         previous = {"id": "int", "name": "str"}
         current = {"id": "int", "name": "str", "height": "int"}
         
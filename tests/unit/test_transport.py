@@ -0,0 +1,91 @@
+"""
+Unit tests for the PokéAPI HTTPX transport.
+
+Tests DNS caching in the custom network backend.
+"""
+
+import pytest
+import httpcore
+from unittest.mock import AsyncMock, patch
+from tests.api.transport import CachingResolverBackend, clear_dns_cache
+
+
+class FakeBackend(httpcore.AsyncNetworkBackend):
+    """Backend that records connection targets instead of connecting."""
+    
+    def __init__(self, fail: bool = False, unreachable=()):
+        self.hosts = []
+        self.fail = fail
+        self.unreachable = set(unreachable)
+    
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.hosts.append(host)
+        if self.fail or host in self.unreachable:
+            raise httpcore.ConnectError("connection refused")
+        return httpcore.AsyncMockStream([])
+    
+    async def sleep(self, seconds):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def empty_dns_cache():
+    """Start and finish each test with an empty DNS cache."""
+    clear_dns_cache()
+    yield
+    clear_dns_cache()
+
+
+@pytest.mark.asyncio
+async def test_resolves_host_once():
+    """Test that repeated connections reuse the cached address."""
+    fake = FakeBackend()
+    backend = CachingResolverBackend(fake)
+    addrinfo = [(2, 1, 6, '', ('104.21.0.1', 443))]
+    
+    with patch('tests.api.transport.anyio.getaddrinfo', new_callable=AsyncMock) as mock_lookup:
+        mock_lookup.return_value = addrinfo
+        
+        await backend.connect_tcp('pokeapi.co', 443)
+        await backend.connect_tcp('pokeapi.co', 443)
+        
+        assert mock_lookup.call_count == 1
+        assert fake.hosts == ['104.21.0.1', '104.21.0.1']
+
+
+@pytest.mark.asyncio
+async def test_failed_connection_evicts_cached_address():
+    """Test that a connect failure forces a fresh lookup next time."""
+    backend = CachingResolverBackend(FakeBackend(fail=True))
+    addrinfo = [(2, 1, 6, '', ('104.21.0.1', 443))]
+    
+    with patch('tests.api.transport.anyio.getaddrinfo', new_callable=AsyncMock) as mock_lookup:
+        mock_lookup.return_value = addrinfo
+        
+        for _ in range(2):
+            with pytest.raises(httpcore.ConnectError):
+                await backend.connect_tcp('pokeapi.co', 443)
+        
+        assert mock_lookup.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_next_resolved_address():
+    """Test that an unreachable first address falls back to the others."""
+    fake = FakeBackend(unreachable={'2606:4700::1'})
+    backend = CachingResolverBackend(fake)
+    addrinfo = [
+        (10, 1, 6, '', ('2606:4700::1', 443, 0, 0)),
+        (2, 1, 6, '', ('104.21.0.1', 443)),
+        (2, 1, 6, '', ('104.21.0.1', 443)),
+    ]
+    
+    with patch('tests.api.transport.anyio.getaddrinfo', new_callable=AsyncMock) as mock_lookup:
+        mock_lookup.return_value = addrinfo
+        
+        await backend.connect_tcp('pokeapi.co', 443)
+        await backend.connect_tcp('pokeapi.co', 443)
+        
+        assert mock_lookup.call_count == 1
+        # The working address is tried first once it has succeeded
+        assert fake.hosts == ['2606:4700::1', '104.21.0.1', '104.21.0.1']
@@ -0,0 +1,377 @@
+"""
+Async database repository layer for storing and retrieving API responses.
+Provides an asyncpg connection pool and CRUD operations for test data,
+for use from async tests without blocking the event loop.
+"""
+
+import asyncio
+import os
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+from datetime import datetime, timedelta
+import asyncpg
+import orjson
+from tests.utils.database import ResponseRow, SchemaRow
+
+
+# Binary jsonb values are the JSON text prefixed with a format version byte
+JSONB_FORMAT_VERSION = b'\x01'
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    """Encode a value in jsonb binary format."""
+    return JSONB_FORMAT_VERSION + orjson.dumps(value)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    """Decode a jsonb binary value, skipping the format version byte."""
+    return orjson.loads(memoryview(data)[1:])
+
+
+# JSON documents at least this long (in characters) are parsed in a worker
+# thread rather than on the event loop
+LARGE_JSON_THRESHOLD = 64 * 1024
+
+
+def _loads_all(texts: List[str]) -> List[Any]:
+    """Parse a batch of JSON documents."""
+    return [orjson.loads(text) for text in texts]
+
+
+async def _decode_json_column(rows: List[Any], column: str) -> List[Any]:
+    """
+    Parse a JSON field fetched as text, in place.
+
+    Small documents are parsed inline; large ones are parsed together in one
+    worker thread. orjson holds the GIL for the whole of each document, so
+    this adds no parallelism and cannot shorten the stall of any single
+    parse, but the loop can run between documents instead of stalling for
+    the whole batch. Only worth it for multi-row results.
+
+    Args:
+        rows: Rows whose column attribute holds JSON text
+        column: Name of the column to parse
+
+    Returns:
+        The same rows, with the column parsed
+    """
+    large = []
+    for row in rows:
+        text = getattr(row, column)
+        if len(text) >= LARGE_JSON_THRESHOLD:
+            large.append(row)
+        else:
+            setattr(row, column, orjson.loads(text))
+
+    if large:
+        parsed = await asyncio.to_thread(_loads_all, [getattr(row, column) for row in large])
+        for row, value in zip(large, parsed):
+            setattr(row, column, value)
+
+    return rows
+
+
+class AsyncResponseRepository:
+    """
+    Async repository for storing and retrieving API responses from PostgreSQL.
+
+    Connections come from an asyncpg pool created by init(), so no handshake
+    or authentication is paid per operation. Queries run over asyncpg's
+    binary protocol, and each connection prepares a statement the first time
+    it sees a query and reuses the plan afterwards (asyncpg's per-connection
+    statement cache). json/jsonb columns are encoded and decoded with orjson
+    through binary codecs. Response history, which may hold many large
+    documents, is read back as text and parsed with _decode_json_column, so
+    the loop can run between documents.
+    """
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        database: Optional[str] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        min_size: int = 1,
+        max_size: int = 10
+    ):
+        """
+        Initialize database connection parameters.
+
+        Args:
+            host: PostgreSQL host (defaults to env var POSTGRES_HOST)
+            port: PostgreSQL port (defaults to env var POSTGRES_PORT)
+            database: Database name (defaults to env var POSTGRES_DB)
+            user: Database user (defaults to env var POSTGRES_USER)
+            password: Database password (defaults to env var POSTGRES_PASSWORD)
+            min_size: Connections the pool keeps open
+            max_size: Upper bound on pooled connections
+        """
+        self.host = host or os.getenv('POSTGRES_HOST', 'localhost')
+        self.port = port or int(os.getenv('POSTGRES_PORT', '5432'))
+        self.database = database or os.getenv('POSTGRES_DB', 'pokeapi_cache')
+        self.user = user or os.getenv('POSTGRES_USER', 'postgres')
+        self.password = password or os.getenv('POSTGRES_PASSWORD', 'postgres')
+        self.min_size = min_size
+        self.max_size = max_size
+        self.pool: Optional[asyncpg.Pool] = None
+
+    async def init(self) -> None:
+        """Create the connection pool if it does not exist yet."""
+        if self.pool is None:
+            self.pool = await asyncpg.create_pool(
+                host=self.host,
+                port=self.port,
+                database=self.database,
+                user=self.user,
+                password=self.password,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                init=self._init_connection
+            )
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.init()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    @staticmethod
+    async def _init_connection(conn: asyncpg.Connection) -> None:
+        """
+        Register orjson codecs for json/jsonb on a new pool connection.
+
+        Binary format is used so the codecs also apply to binary COPY
+        (store_responses_bulk); binary json is plain UTF-8 JSON text.
+        """
+        await conn.set_type_codec(
+            'jsonb',
+            encoder=_encode_jsonb,
+            decoder=_decode_jsonb,
+            schema='pg_catalog',
+            format='binary'
+        )
+        await conn.set_type_codec(
+            'json',
+            encoder=orjson.dumps,
+            decoder=orjson.loads,
+            schema='pg_catalog',
+            format='binary'
+        )
+
+    def _get_pool(self) -> asyncpg.Pool:
+        """
+        Get the connection pool.
+
+        Raises:
+            RuntimeError: If init() has not been awaited
+        """
+        if self.pool is None:
+            raise RuntimeError("AsyncResponseRepository.init() must be awaited before use")
+        return self.pool
+
+    async def store_response(
+        self,
+        endpoint: str,
+        resource_id: int,
+        response_data: Dict[Any, Any]
+    ) -> int:
+        """
+        Store an API response in the database.
+
+        Args:
+            endpoint: API endpoint name (e.g., 'pokemon', 'type', 'ability')
+            resource_id: Resource identifier (e.g., pokemon ID)
+            response_data: Complete JSON response from API
+
+        Returns:
+            ID of the inserted record
+        """
+        return await self._get_pool().fetchval(
+            """
+            INSERT INTO api_responses (endpoint, resource_id, response_data, created_at)
+            VALUES ($1, $2, $3, $4)
+            RETURNING id
+            """,
+            endpoint, resource_id, response_data, datetime.utcnow()
+        )
+
+    async def store_responses_bulk(
+        self,
+        rows: Sequence[Tuple[str, int, Dict[Any, Any]]]
+    ) -> int:
+        """
+        Store many API responses in a single round-trip using binary COPY.
+
+        COPY does not return generated IDs; use the synchronous
+        ResponseRepository.store_responses_bulk when IDs are needed.
+
+        Args:
+            rows: (endpoint, resource_id, response_data) tuples
+
+        Returns:
+            Number of rows stored
+        """
+        if not rows:
+            return 0
+
+        # Offset timestamps by one microsecond per row so repeated
+        # (endpoint, resource_id) pairs keep their order and don't collide
+        # on the UNIQUE(endpoint, resource_id, created_at) constraint
+        now = datetime.utcnow()
+        records = [
+            (endpoint, resource_id, response_data, now + timedelta(microseconds=i))
+            for i, (endpoint, resource_id, response_data) in enumerate(rows)
+        ]
+
+        async with self._get_pool().acquire() as conn:
+            status = await conn.copy_records_to_table(
+                'api_responses',
+                records=records,
+                columns=['endpoint', 'resource_id', 'response_data', 'created_at']
+            )
+
+        # Command status is e.g. "COPY 3"
+        return int(status.split()[-1])
+
+    async def get_latest_response(
+        self,
+        endpoint: str,
+        resource_id: int
+    ) -> Optional[ResponseRow]:
+        """
+        Retrieve the most recent API response for a given endpoint and resource.
+
+        Args:
+            endpoint: API endpoint name
+            resource_id: Resource identifier
+
+        Returns:
+            The stored response with its metadata, or None if not found
+        """
+        result = await self._get_pool().fetchrow(
+            """
+            SELECT id, endpoint, resource_id, response_data, created_at
+            FROM api_responses
+            WHERE endpoint = $1 AND resource_id = $2
+            ORDER BY created_at DESC
+            LIMIT 1
+            """,
+            endpoint, resource_id
+        )
+        return ResponseRow(*result) if result else None
+
+    async def store_schema_version(
+        self,
+        endpoint: str,
+        schema_structure: Dict[Any, Any]
+    ) -> int:
+        """
+        Store a schema version for an endpoint.
+
+        Args:
+            endpoint: API endpoint name
+            schema_structure: JSON representation of the schema structure
+
+        Returns:
+            ID of the inserted record
+        """
+        return await self._get_pool().fetchval(
+            """
+            INSERT INTO schema_versions (endpoint, schema_structure, created_at)
+            VALUES ($1, $2, $3)
+            RETURNING id
+            """,
+            endpoint, schema_structure, datetime.utcnow()
+        )
+
+    async def get_latest_schema(
+        self,
+        endpoint: str
+    ) -> Optional[SchemaRow]:
+        """
+        Retrieve the most recent schema version for an endpoint.
+
+        Args:
+            endpoint: API endpoint name
+
+        Returns:
+            The stored schema version with its metadata, or None if not found
+        """
+        result = await self._get_pool().fetchrow(
+            """
+            SELECT id, endpoint, schema_structure, created_at
+            FROM schema_versions
+            WHERE endpoint = $1
+            ORDER BY created_at DESC
+            LIMIT 1
+            """,
+            endpoint
+        )
+        return SchemaRow(*result) if result else None
+
+    async def get_all_responses(
+        self,
+        endpoint: str,
+        resource_id: int
+    ) -> List[ResponseRow]:
+        """
+        Retrieve all stored responses for a given endpoint and resource.
+        Useful for historical comparison.
+
+        Args:
+            endpoint: API endpoint name
+            resource_id: Resource identifier
+
+        Returns:
+            Stored responses with their metadata, newest first
+        """
+        results = await self._get_pool().fetch(
+            """
+            SELECT id, endpoint, resource_id, response_data::text AS response_data, created_at
+            FROM api_responses
+            WHERE endpoint = $1 AND resource_id = $2
+            ORDER BY created_at DESC
+            """,
+            endpoint, resource_id
+        )
+        return await _decode_json_column([ResponseRow(*row) for row in results], 'response_data')
+
+    async def clear_responses(self, endpoint: Optional[str] = None) -> int:
+        """
+        Clear stored responses. Used for testing cleanup.
+
+        Args:
+            endpoint: If provided, only clear responses for this endpoint.
+                     If None, clear all responses.
+
+        Returns:
+            Number of rows deleted
+        """
+        pool = self._get_pool()
+        if endpoint:
+            status = await pool.execute(
+                "DELETE FROM api_responses WHERE endpoint = $1",
+                endpoint
+            )
+        else:
+            status = await pool.execute("DELETE FROM api_responses")
+
+        # Command status is e.g. "DELETE 3"
+        return int(status.split()[-1])
+
+    async def truncate_responses(self) -> None:
+        """
+        Remove all stored responses and reset the ID sequence.
+        Faster than clear_responses() for full cleanup between tests,
+        since TRUNCATE does not scan the table.
+        """
+        await self._get_pool().execute("TRUNCATE api_responses RESTART IDENTITY")
@@ -5,10 +5,10 @@ Prevents cascading failures by opening the circuit after repeated failures
 and allowing time for the service to recover.
 """
 
-import asyncio
-import time
-from typing import Callable, Any, Optional
-from collections import deque
+import math
+from time import monotonic_ns
+from array import array
+from typing import Callable, Any, List, Optional, Tuple
 from enum import Enum
 
 
@@ -26,6 +26,10 @@ class CircuitBreaker:
     Tracks failure rates per endpoint and opens the circuit when
     failures exceed the threshold. After a timeout period, the circuit
     enters half-open state to test recovery.
+    
+    No lock is taken: every state update runs between awaits, never across
+    one, so updates cannot interleave on a single event loop. Instances are
+    not safe to share across threads.
     """
     
     def __init__(
@@ -34,7 +38,9 @@ class CircuitBreaker:
         timeout: float = 30.0,
         window_size: int = 10,
         window_duration: float = 300.0,
-        success_threshold: int = 3
+        success_threshold: int = 3,
+        max_rps: int = 2000,
+        name: Optional[str] = None
     ):
         """
         Initialize the circuit breaker.
@@ -45,31 +51,106 @@ class CircuitBreaker:
             window_size: Minimum number of requests before evaluating failure rate
             window_duration: Time window in seconds for tracking failures (5 minutes)
             success_threshold: Consecutive successes needed to close circuit from half-open
+            max_rps: Highest expected request rate; the window keeps at most
+                max_rps * window_duration requests, evicting the oldest beyond that
+            name: Endpoint name included in the open-circuit error message
         """
         self.failure_threshold = failure_threshold
         self.timeout = timeout
         self.window_size = window_size
         self.window_duration = window_duration
         self.success_threshold = success_threshold
+        self.max_rps = max_rps
+        self.name = name
+        
+        # Timestamps are integer monotonic_ns() values; durations are
+        # converted to nanoseconds once so window checks are integer compares
+        self._window_ns = int(window_duration * 1_000_000_000)
+        self._timeout_ns = int(timeout * 1_000_000_000)
+        
+        # Threshold as a fixed-point integer (1/10_000ths), so the check in
+        # record_failure compares integer products instead of dividing
+        self._scale = 10_000
+        self._failure_threshold_num = round(failure_threshold * self._scale)
         
         self.state = CircuitState.CLOSED
         self.failure_count = 0
         self.success_count = 0
-        self.last_failure_time: Optional[float] = None
-        self.opened_at: Optional[float] = None
+        self.last_failure_time: Optional[int] = None
+        self.opened_at: Optional[int] = None
+        # monotonic_ns() reading at which an open circuit goes half-open,
+        # set whenever the circuit opens
+        self._half_open_deadline_ns = 0
         
-        # Sliding window for tracking request outcomes (timestamp, success)
-        self.request_history: deque = deque()
+        # Raised for every rejected call, so fail-fast rejections don't build
+        # a new exception and message each time; see open_error()
+        self._open_error = CircuitBreakerOpenError(
+            f"Circuit breaker is open for endpoint: {name}" if name else "Circuit breaker is open"
+        )
         
-        self.lock = asyncio.Lock()
+        # Sliding window of request outcomes, stored as parallel arrays of
+        # timestamps and success flags (1 or 0) rather than a tuple per
+        # request. Live entries start at _head; evicted ones are dropped
+        # from the front in bulk once they make up half the arrays. The
+        # window is capped at _capacity entries so bursts can't grow it
+        self._capacity = max(1, math.ceil(max_rps * window_duration))
+        self._ts = array('q')
+        self._ok = array('b')
+        self._head = 0
+        # Failed entries currently in the window, maintained on append and
+        # eviction so the failure rate needs no scan of the window
+        self._failures_in_window = 0
+    
+    @property
+    def request_history(self) -> List[Tuple[int, bool]]:
+        """Requests in the sliding window as (timestamp, success) pairs, oldest first."""
+        head = self._head
+        return [(ts, bool(ok)) for ts, ok in zip(self._ts[head:], self._ok[head:])]
     
-    def _clean_old_requests(self) -> None:
-        """Remove requests outside the sliding window."""
-        now = time.monotonic()
-        cutoff = now - self.window_duration
+    def _window_len(self) -> int:
+        """Number of requests in the sliding window."""
+        return len(self._ts) - self._head
+    
+    def _record(self, now: int, success: bool) -> None:
+        """Append a request outcome, evicting the oldest if the window is full."""
+        if self._window_len() >= self._capacity:
+            head = self._head
+            if not self._ok[head]:
+                self._failures_in_window -= 1
+            self._head = head + 1
+            self._compact()
         
-        while self.request_history and self.request_history[0][0] < cutoff:
-            self.request_history.popleft()
+        self._ts.append(now)
+        self._ok.append(success)
+    
+    def _compact(self) -> None:
+        """Drop evicted entries once they make up half the arrays."""
+        head = self._head
+        if head * 2 > len(self._ts):
+            del self._ts[:head]
+            del self._ok[:head]
+            self._head = 0
+    
+    def _clean_old_requests(self, now: Optional[int] = None) -> None:
+        """
+        Remove requests outside the sliding window.
+        
+        Args:
+            now: Current monotonic_ns() reading, if the caller already took one
+        """
+        if now is None:
+            now = monotonic_ns()
+        cutoff = now - self._window_ns
+        
+        ts, ok = self._ts, self._ok
+        head, end = self._head, len(ts)
+        while head < end and ts[head] < cutoff:
+            if not ok[head]:
+                self._failures_in_window -= 1
+            head += 1
+        
+        self._head = head
+        self._compact()
     
     def _calculate_failure_rate(self) -> float:
         """
@@ -80,11 +161,11 @@ class CircuitBreaker:
         """
         self._clean_old_requests()
         
-        if len(self.request_history) < self.window_size:
+        n = self._window_len()
+        if n < self.window_size:
             return 0.0
         
-        failures = sum(1 for _, success in self.request_history if not success)
-        return failures / len(self.request_history)
+        return self._failures_in_window / n
     
     async def call(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -102,22 +183,11 @@ class CircuitBreaker:
             CircuitBreakerOpenError: If circuit is open
             Exception: Any exception raised by the function
         """
-        async with self.lock:
-            # Check if we should transition from OPEN to HALF_OPEN
-            if self.state == CircuitState.OPEN:
-                if self.opened_at and (time.monotonic() - self.opened_at) >= self.timeout:
-                    self.state = CircuitState.HALF_OPEN
-                    self.success_count = 0
-                else:
-                    raise CircuitBreakerOpenError(
-                        f"Circuit breaker is open. Opened at {self.opened_at}"
-                    )
-            
-            # In HALF_OPEN state, only allow limited requests through
-            if self.state == CircuitState.HALF_OPEN:
-                pass  # Allow the request to proceed
+        # Lock-free fast path: a closed circuit needs no further checks, and
+        # is_open() handles the OPEN to HALF_OPEN transition on its own
+        if self.state is not CircuitState.CLOSED and self.is_open():
+            raise self.open_error() from None
         
-        # Execute the function outside the lock to avoid blocking
         try:
             result = await func(*args, **kwargs)
             await self.record_success()
@@ -128,48 +198,80 @@ class CircuitBreaker:
     
     async def record_success(self) -> None:
         """Record a successful request."""
-        async with self.lock:
-            now = time.monotonic()
-            self.request_history.append((now, True))
-            
-            if self.state == CircuitState.HALF_OPEN:
-                self.success_count += 1
-                if self.success_count >= self.success_threshold:
-                    # Close the circuit after enough consecutive successes
-                    self.state = CircuitState.CLOSED
-                    self.failure_count = 0
-                    self.success_count = 0
-                    self.opened_at = None
+        now = monotonic_ns()
+        self._record(now, True)
+        
+        if self.state == CircuitState.HALF_OPEN:
+            self.success_count += 1
+            if self.success_count >= self.success_threshold:
+                # Close the circuit after enough consecutive successes
+                self.state = CircuitState.CLOSED
+                self.failure_count = 0
+                self.success_count = 0
+                self.opened_at = None
+                self._half_open_deadline_ns = 0
+    
+    def _open(self, now: int) -> None:
+        """Open the circuit and set the deadline for entering half-open state."""
+        self.state = CircuitState.OPEN
+        self.opened_at = now
+        self._half_open_deadline_ns = now + self._timeout_ns
     
     async def record_failure(self) -> None:
         """Record a failed request and potentially open the circuit."""
-        async with self.lock:
-            now = time.monotonic()
-            self.request_history.append((now, False))
-            self.last_failure_time = now
+        now = monotonic_ns()
+        self._record(now, False)
+        self._failures_in_window += 1
+        self.last_failure_time = now
+        
+        if self.state == CircuitState.HALF_OPEN:
+            # Failure in half-open state reopens the circuit
+            self._open(now)
+            self.success_count = 0
+        elif self.state == CircuitState.CLOSED:
+            # Check if we should open the circuit: failures / n >= threshold,
+            # rearranged to avoid the division
+            self._clean_old_requests(now)
+            n = self._window_len()
             
-            if self.state == CircuitState.HALF_OPEN:
-                # Failure in half-open state reopens the circuit
-                self.state = CircuitState.OPEN
-                self.opened_at = now
-                self.success_count = 0
-            elif self.state == CircuitState.CLOSED:
-                # Check if we should open the circuit
-                failure_rate = self._calculate_failure_rate()
-                
-                if (len(self.request_history) >= self.window_size and 
-                    failure_rate >= self.failure_threshold):
-                    self.state = CircuitState.OPEN
-                    self.opened_at = now
+            if (n >= self.window_size and
+                self._failures_in_window * self._scale >= self._failure_threshold_num * n):
+                self._open(now)
     
     def is_open(self) -> bool:
         """
         Check if the circuit is currently open.
         
+        Lock-free: this only reads state, and the OPEN to HALF_OPEN
+        transition happens without awaiting, so it cannot interleave with
+        other tasks. Once the timeout has elapsed the circuit enters
+        half-open state and the caller's request acts as the probe.
+        
         Returns:
             True if circuit is open, False otherwise
         """
-        return self.state == CircuitState.OPEN
+        if self.state is not CircuitState.OPEN:
+            return False
+        
+        if monotonic_ns() >= self._half_open_deadline_ns:
+            self.state = CircuitState.HALF_OPEN
+            self.success_count = 0
+            return False
+        
+        return True
+    
+    def open_error(self) -> "CircuitBreakerOpenError":
+        """
+        Get the exception to raise for a call rejected by the open circuit.
+        
+        The same instance is reused for every rejection, with its traceback
+        cleared so repeated raises don't grow it. It carries no timestamp;
+        read opened_at from the breaker instead.
+        
+        Returns:
+            The breaker's CircuitBreakerOpenError
+        """
+        return self._open_error.with_traceback(None)
     
     def get_state(self) -> CircuitState:
         """
@@ -200,7 +302,11 @@ class CircuitBreaker:
         self.success_count = 0
         self.last_failure_time = None
         self.opened_at = None
-        self.request_history.clear()
+        self._half_open_deadline_ns = 0
+        del self._ts[:]
+        del self._ok[:]
+        self._head = 0
+        self._failures_in_window = 0
 
 
 class CircuitBreakerOpenError(Exception):
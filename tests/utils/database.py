@@ -3,17 +3,102 @@ Database repository layer for storing and retrieving API responses.
 Provides connection management and CRUD operations for test data.
 """
 
+import atexit
 import os
-import json
-from typing import Optional, Dict, Any
-from datetime import datetime
-import psycopg2
-from psycopg2.extras import RealDictCursor, Json
+import threading
+import weakref
+from typing import Optional, Dict, Any, Iterator, List, Sequence, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import orjson
+from psycopg2.extras import Json, execute_values, register_default_jsonb
+from psycopg2.pool import AbstractConnectionPool, ThreadedConnectionPool
 from contextlib import contextmanager
 
 
+# Upper bound on connections in a repository's own pool
+POOL_MAX_CONNECTIONS = int(os.getenv('PG_POOL_MAX', '16'))
+
+# Rows fetched per round-trip when streaming response history
+HISTORY_FETCH_SIZE = 500
+
+# Statements prepared once per connection, so Postgres parses and plans
+# them once per connection lifetime instead of on every call
+PREPARED_STATEMENTS = {
+    'store_response': """
+        PREPARE store_response(varchar, integer, jsonb, timestamp) AS
+        INSERT INTO api_responses (endpoint, resource_id, response_data, created_at)
+        VALUES ($1, $2, $3, $4)
+        RETURNING id
+    """,
+    'get_latest_response': """
+        PREPARE get_latest_response(varchar, integer) AS
+        SELECT id, endpoint, resource_id, response_data, created_at
+        FROM api_responses
+        WHERE endpoint = $1 AND resource_id = $2
+        ORDER BY created_at DESC
+        LIMIT 1
+    """,
+    'store_schema_version': """
+        PREPARE store_schema_version(varchar, jsonb, timestamp) AS
+        INSERT INTO schema_versions (endpoint, schema_structure, created_at)
+        VALUES ($1, $2, $3)
+        RETURNING id
+    """,
+    'get_latest_schema': """
+        PREPARE get_latest_schema(varchar) AS
+        SELECT id, endpoint, schema_structure, created_at
+        FROM schema_versions
+        WHERE endpoint = $1
+        ORDER BY created_at DESC
+        LIMIT 1
+    """,
+}
+
+
+# Connections that already hold PREPARED_STATEMENTS. Prepared statements
+# belong to the server connection, not to a repository, so this is shared
+# by every repository that may borrow the connection from an injected pool
+_PREPARED_CONNECTIONS: "weakref.WeakSet" = weakref.WeakSet()
+
+
+class OrJson(Json):
+    """psycopg2 JSON adapter that serializes with orjson instead of json.dumps."""
+    
+    def dumps(self, obj: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+
+@dataclass(slots=True)
+class ResponseRow:
+    """A stored API response; fields follow the api_responses column order."""
+    id: int
+    endpoint: str
+    resource_id: int
+    response_data: Any
+    created_at: datetime
+
+
+@dataclass(slots=True)
+class SchemaRow:
+    """A stored schema version; fields follow the schema_versions column order."""
+    id: int
+    endpoint: str
+    schema_structure: Any
+    created_at: datetime
+
+
 class ResponseRepository:
-    """Repository for storing and retrieving API responses from PostgreSQL."""
+    """
+    Repository for storing and retrieving API responses from PostgreSQL.
+    
+    Connections are borrowed from a ThreadedConnectionPool, so TCP setup and
+    authentication are paid once per pooled connection rather than per
+    operation. Unless a pool is injected, the repository creates its own on
+    first use (so constructing one needs no database) and closes it in
+    close() or at interpreter exit.
+    """
     
     def __init__(
         self,
@@ -21,7 +106,8 @@ class ResponseRepository:
         port: Optional[int] = None,
         database: Optional[str] = None,
         user: Optional[str] = None,
-        password: Optional[str] = None
+        password: Optional[str] = None,
+        pool: Optional[AbstractConnectionPool] = None
     ):
         """
         Initialize database connection parameters.
@@ -32,28 +118,76 @@ class ResponseRepository:
             database: Database name (defaults to env var POSTGRES_DB)
             user: Database user (defaults to env var POSTGRES_USER)
             password: Database password (defaults to env var POSTGRES_PASSWORD)
+            pool: Optional connection pool to borrow connections from; the
+                  caller keeps ownership of it. When omitted, a pool of up to
+                  PG_POOL_MAX (default 16) connections is created on first use
         """
         self.host = host or os.getenv('POSTGRES_HOST', 'localhost')
         self.port = port or int(os.getenv('POSTGRES_PORT', '5432'))
         self.database = database or os.getenv('POSTGRES_DB', 'pokeapi_cache')
         self.user = user or os.getenv('POSTGRES_USER', 'postgres')
         self.password = password or os.getenv('POSTGRES_PASSWORD', 'postgres')
+        self.pool = pool
+        self._owns_pool = False
+        self._pool_lock = threading.Lock()
+    
+    def _get_pool(self) -> AbstractConnectionPool:
+        """Get the connection pool, creating the repository's own if needed."""
+        if self.pool is None:
+            with self._pool_lock:
+                if self.pool is None:
+                    self.pool = ThreadedConnectionPool(
+                        1,
+                        POOL_MAX_CONNECTIONS,
+                        host=self.host,
+                        port=self.port,
+                        database=self.database,
+                        user=self.user,
+                        password=self.password
+                    )
+                    self._owns_pool = True
+                    atexit.register(self.close)
+        return self.pool
+    
+    def close(self) -> None:
+        """Close the repository's own connection pool; injected pools are left open."""
+        if self._owns_pool and self.pool is not None:
+            self.pool.closeall()
+            self.pool = None
+            self._owns_pool = False
+            atexit.unregister(self.close)
+    
+    def _prepare_statements(self, conn) -> None:
+        """
+        Prepare PREPARED_STATEMENTS on a connection that does not have them yet.
+        
+        Prepared statements outlive the transaction that created them, so
+        this runs once per pooled connection, in a single round-trip.
+        
+        Args:
+            conn: Open connection
+        """
+        if conn in _PREPARED_CONNECTIONS:
+            return
+        with conn.cursor() as cursor:
+            cursor.execute(";".join(PREPARED_STATEMENTS.values()))
+        _PREPARED_CONNECTIONS.add(conn)
     
     @contextmanager
     def get_connection(self):
         """
         Context manager for database connections.
-        Automatically handles connection cleanup.
+        Automatically handles connection cleanup, returning connections
+        to the pool instead of closing them.
         """
+        pool = self._get_pool()
         conn = None
         try:
-            conn = psycopg2.connect(
-                host=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.user,
-                password=self.password
-            )
+            conn = pool.getconn()
+            # Decode jsonb columns with orjson; uses the builtin type OIDs,
+            # so registering costs no query
+            register_default_jsonb(conn, loads=orjson.loads)
+            self._prepare_statements(conn)
             yield conn
             conn.commit()
         except Exception as e:
@@ -62,7 +196,7 @@ class ResponseRepository:
             raise
         finally:
             if conn:
-                conn.close()
+                pool.putconn(conn)
     
     def store_response(
         self,
@@ -85,21 +219,80 @@ class ResponseRepository:
         with self.get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
+                    "EXECUTE store_response(%s, %s, %s, %s)",
+                    (endpoint, resource_id, OrJson(response_data), datetime.utcnow())
+                )
+                result = cursor.fetchone()
+                return result[0]
+    
+    def store_responses_bulk(
+        self,
+        rows: Sequence[Tuple[str, int, Dict[Any, Any]]]
+    ) -> List[int]:
+        """
+        Store many API responses in a single round-trip.
+        
+        Args:
+            rows: (endpoint, resource_id, response_data) tuples
+            
+        Returns:
+            IDs of the inserted records, in the same order as rows
+        """
+        if not rows:
+            return []
+        
+        # Offset timestamps by one microsecond per row so repeated
+        # (endpoint, resource_id) pairs keep their order and don't collide
+        # on the UNIQUE(endpoint, resource_id, created_at) constraint
+        now = datetime.utcnow()
+        values = [
+            (endpoint, resource_id, OrJson(response_data), now + timedelta(microseconds=i))
+            for i, (endpoint, resource_id, response_data) in enumerate(rows)
+        ]
+        
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                results = execute_values(
+                    cursor,
                     """
                     INSERT INTO api_responses (endpoint, resource_id, response_data, created_at)
-                    VALUES (%s, %s, %s, %s)
+                    VALUES %s
                     RETURNING id
                     """,
-                    (endpoint, resource_id, Json(response_data), datetime.utcnow())
+                    values,
+                    page_size=500,
+                    fetch=True
                 )
-                result = cursor.fetchone()
-                return result[0]
+                return [row[0] for row in results]
+    
+    def get_responses_by_ids(self, record_ids: Sequence[int]) -> List[ResponseRow]:
+        """
+        Retrieve stored responses by record ID in a single query.
+        
+        Args:
+            record_ids: Record IDs returned by store_response/store_responses_bulk
+            
+        Returns:
+            Stored responses, ordered by ID
+        """
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT id, endpoint, resource_id, response_data, created_at
+                    FROM api_responses
+                    WHERE id = ANY(%s)
+                    ORDER BY id
+                    """,
+                    (list(record_ids),)
+                )
+                return [ResponseRow(*row) for row in cursor.fetchall()]
     
     def get_latest_response(
         self,
         endpoint: str,
         resource_id: int
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[ResponseRow]:
         """
         Retrieve the most recent API response for a given endpoint and resource.
         
@@ -108,23 +301,17 @@ class ResponseRepository:
             resource_id: Resource identifier
             
         Returns:
-            Dictionary containing the response data and metadata, or None if not found
+            The stored response with its metadata, or None if not found
         """
         with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            with conn.cursor() as cursor:
                 cursor.execute(
-                    """
-                    SELECT id, endpoint, resource_id, response_data, created_at
-                    FROM api_responses
-                    WHERE endpoint = %s AND resource_id = %s
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                    """,
+                    "EXECUTE get_latest_response(%s, %s)",
                     (endpoint, resource_id)
                 )
                 result = cursor.fetchone()
                 if result:
-                    return dict(result)
+                    return ResponseRow(*result)
                 return None
     
     def store_schema_version(
@@ -145,12 +332,8 @@ class ResponseRepository:
         with self.get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
-                    """
-                    INSERT INTO schema_versions (endpoint, schema_structure, created_at)
-                    VALUES (%s, %s, %s)
-                    RETURNING id
-                    """,
-                    (endpoint, Json(schema_structure), datetime.utcnow())
+                    "EXECUTE store_schema_version(%s, %s, %s)",
+                    (endpoint, OrJson(schema_structure), datetime.utcnow())
                 )
                 result = cursor.fetchone()
                 return result[0]
@@ -158,7 +341,7 @@ class ResponseRepository:
     def get_latest_schema(
         self,
         endpoint: str
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[SchemaRow]:
         """
         Retrieve the most recent schema version for an endpoint.
         
@@ -166,43 +349,43 @@ class ResponseRepository:
             endpoint: API endpoint name
             
         Returns:
-            Dictionary containing the schema structure and metadata, or None if not found
+            The stored schema version with its metadata, or None if not found
         """
         with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            with conn.cursor() as cursor:
                 cursor.execute(
-                    """
-                    SELECT id, endpoint, schema_structure, created_at
-                    FROM schema_versions
-                    WHERE endpoint = %s
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                    """,
+                    "EXECUTE get_latest_schema(%s)",
                     (endpoint,)
                 )
                 result = cursor.fetchone()
                 if result:
-                    return dict(result)
+                    return SchemaRow(*result)
                 return None
     
     def get_all_responses(
         self,
         endpoint: str,
         resource_id: int
-    ) -> list[Dict[str, Any]]:
+    ) -> Iterator[ResponseRow]:
         """
         Retrieve all stored responses for a given endpoint and resource.
         Useful for historical comparison.
         
+        Rows are streamed through a server-side cursor in batches of
+        HISTORY_FETCH_SIZE, so long histories are never held in memory at
+        once. The connection stays checked out until the iterator is
+        exhausted or closed; wrap the call in list() to materialize it.
+        
         Args:
             endpoint: API endpoint name
             resource_id: Resource identifier
             
-        Returns:
-            List of dictionaries containing response data and metadata
+        Yields:
+            Stored responses with their metadata, newest first
         """
         with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            with conn.cursor(name='get_all_responses') as cursor:
+                cursor.itersize = HISTORY_FETCH_SIZE
                 cursor.execute(
                     """
                     SELECT id, endpoint, resource_id, response_data, created_at
@@ -212,8 +395,8 @@ class ResponseRepository:
                     """,
                     (endpoint, resource_id)
                 )
-                results = cursor.fetchall()
-                return [dict(row) for row in results]
+                for row in cursor:
+                    yield ResponseRow(*row)
     
     def clear_responses(self, endpoint: Optional[str] = None) -> int:
         """
@@ -236,3 +419,13 @@ class ResponseRepository:
                 else:
                     cursor.execute("DELETE FROM api_responses")
                 return cursor.rowcount
+    
+    def truncate_responses(self) -> None:
+        """
+        Remove all stored responses and reset the ID sequence.
+        Faster than clear_responses() for full cleanup between tests,
+        since TRUNCATE does not scan the table.
+        """
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("TRUNCATE api_responses RESTART IDENTITY")
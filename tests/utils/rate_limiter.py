@@ -5,8 +5,9 @@ Provides async rate limiting to prevent overwhelming the PokéAPI service.
 """
 
 import asyncio
-import time
-from typing import Optional
+from time import monotonic_ns
+from collections import deque
+from typing import Deque, Optional
 
 
 class RateLimiter:
@@ -15,6 +16,13 @@ class RateLimiter:
     
     The token bucket algorithm allows bursts up to the bucket capacity
     while maintaining an average rate over time.
+    
+    Callers that find the bucket empty wait in FIFO order on a future of
+    their own. A single timer wakes up when the next token is due and
+    hands tokens to waiters in arrival order, so waiters neither poll nor
+    wake each other. No lock is taken: bookkeeping never spans an await,
+    so it cannot interleave on a single event loop. Instances are not safe
+    to share across threads.
     """
     
     def __init__(
@@ -32,42 +40,76 @@ class RateLimiter:
         self.max_requests = max_requests
         self.time_window = time_window
         self.tokens = float(max_requests)
-        self.last_update = time.monotonic()
-        self.lock = asyncio.Lock()
+        # Integer monotonic_ns() timestamp of the last refill
+        self.last_update = monotonic_ns()
         
         # Calculate token refill rate (tokens per second)
         self.refill_rate = max_requests / time_window
+        # Same rate per nanosecond, so elapsed time needs no unit conversion
+        self._refill_per_ns = self.refill_rate / 1_000_000_000
+        
+        # Callers waiting for a token, oldest first
+        self._waiters: Deque[asyncio.Future] = deque()
+        # Pending timer that grants the next token to waiters
+        self._grant_handle: Optional[asyncio.TimerHandle] = None
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = monotonic_ns()
+        self.tokens = min(
+            self.max_requests,
+            self.tokens + (now - self.last_update) * self._refill_per_ns
+        )
+        self.last_update = now
+    
+    def _schedule_grant(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Arm the grant timer for when the next token is due, if not armed."""
+        if self._grant_handle is None:
+            wait_time = max(0.0, (1.0 - self.tokens) / self.refill_rate)
+            self._grant_handle = loop.call_later(wait_time, self._grant, loop)
+    
+    def _grant(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Hand available tokens to waiters in FIFO order."""
+        self._grant_handle = None
+        self._refill()
+        
+        waiters = self._waiters
+        while waiters and self.tokens >= 1.0:
+            waiter = waiters.popleft()
+            # Skip waiters whose acquire() was cancelled
+            if not waiter.done():
+                self.tokens -= 1.0
+                waiter.set_result(None)
+        
+        if waiters:
+            self._schedule_grant(loop)
     
     async def acquire(self) -> None:
         """
         Acquire a token to make a request.
         
-        If no tokens are available, this method will wait until a token
-        becomes available through the refill process.
+        If no tokens are available, or other callers are already waiting,
+        this method waits its turn until a token is granted to it.
         """
-        async with self.lock:
-            while True:
-                now = time.monotonic()
-                time_passed = now - self.last_update
-                
-                # Refill tokens based on time passed
-                self.tokens = min(
-                    self.max_requests,
-                    self.tokens + time_passed * self.refill_rate
-                )
-                self.last_update = now
-                
-                # If we have tokens available, consume one and return
-                if self.tokens >= 1.0:
-                    self.tokens -= 1.0
-                    return
-                
-                # Calculate wait time until next token is available
-                wait_time = (1.0 - self.tokens) / self.refill_rate
-                
-                # Release lock while waiting to allow other operations
-                # Wait for the calculated time
-                await asyncio.sleep(wait_time)
+        self._refill()
+        
+        # Take a token directly only if nobody is queued ahead of us
+        if not self._waiters and self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return
+        
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        self._schedule_grant(loop)
+        
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just before the cancellation landed; give it back
+                self.tokens += 1.0
+            raise
     
     def reset(self) -> None:
         """
@@ -76,7 +118,7 @@ class RateLimiter:
         Useful for testing or when starting a new rate limit period.
         """
         self.tokens = float(self.max_requests)
-        self.last_update = time.monotonic()
+        self.last_update = monotonic_ns()
     
     def get_available_tokens(self) -> float:
         """
@@ -85,10 +127,7 @@ class RateLimiter:
         Returns:
             Number of tokens currently available (may be fractional)
         """
-        now = time.monotonic()
-        time_passed = now - self.last_update
-        
         return min(
             self.max_requests,
-            self.tokens + time_passed * self.refill_rate
+            self.tokens + (monotonic_ns() - self.last_update) * self._refill_per_ns
         )
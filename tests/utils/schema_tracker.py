@@ -3,9 +3,94 @@ Schema tracking functionality for detecting API schema changes.
 Extracts schema structure from JSON responses and compares versions.
 """
 
-from typing import Dict, Any, List, Set, Optional
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
+from itertools import count
+import multiprocessing
+import os
+from sys import intern
+from typing import Callable, Dict, Any, List, Sequence, Set, Optional, Tuple, Union
+from dataclasses import dataclass
 from enum import Enum
+import orjson
+
+
+# Size in bytes of the body digests keying the schema cache; 128 bits makes
+# collisions between distinct bodies negligible
+BODY_DIGEST_SIZE = 16
+
+# Summary of a SchemaDiff with no changes
+NO_CHANGES_SUMMARY = "No schema changes detected"
+
+# Type names for the exact types orjson produces, looked up with type(value)
+_TYPE_NAMES: Dict[type, str] = {
+    type(None): "null",
+    bool: "bool",
+    int: "int",
+    float: "float",
+    str: "str",
+    list: "list",
+    dict: "dict",
+}
+
+
+# Interned field paths, keyed by prefix and then by key. Each walked level
+# looks up its prefix once and then finds each child path with a single
+# dict lookup, so paths recurring across responses are neither formatted
+# nor interned again. Interned paths are shared across schemas and
+# compare by identity in compare_schemas.
+_PATH_CACHE: Dict[str, Dict[str, str]] = {}
+
+# Bounds on _PATH_CACHE: prefixes kept, and paths kept per prefix
+PATH_CACHE_PREFIXES = 4096
+PATH_CACHE_KEYS = 1024
+
+
+def _child_paths(prefix: str) -> Dict[str, str]:
+    """Get the cached child paths under a prefix, starting over if the cache is full."""
+    paths = _PATH_CACHE.get(prefix)
+    if paths is None:
+        if len(_PATH_CACHE) >= PATH_CACHE_PREFIXES:
+            _PATH_CACHE.clear()
+        paths = _PATH_CACHE[prefix] = {}
+    return paths
+
+
+def _new_path(paths: Dict[str, str], prefix: str, key: Any) -> str:
+    """
+    Build the interned field path for a key missing from paths.
+    
+    Only str keys are cached: keys that compare equal across types
+    (1, 1.0, True) must keep their own spelling.
+    """
+    field_path = intern(f"{prefix}.{key}" if prefix else f"{key}")
+    if type(key) is str and len(paths) < PATH_CACHE_KEYS:
+        paths[key] = field_path
+    return field_path
+
+
+def _type_name(value: Any) -> str:
+    """
+    Name the type of a value not found in _TYPE_NAMES.
+    
+    Subclasses of the JSON types (e.g. IntEnum, OrderedDict) are named after
+    the JSON type they extend; anything else by its class name.
+    """
+    if isinstance(value, bool):
+        # Check bool before int since bool is subclass of int
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "str"
+    if isinstance(value, list):
+        return "list"
+    if isinstance(value, dict):
+        return "dict"
+    return type(value).__name__
 
 
 class ChangeType(Enum):
@@ -15,7 +100,16 @@ class ChangeType(Enum):
     TYPE_CHANGED = "type_changed"
 
 
-@dataclass
+# Message templates for SchemaChange.__str__, keyed by change type
+# (p = field path, o = old type, n = new type)
+_CHANGE_FORMATS: Dict[ChangeType, str] = {
+    ChangeType.FIELD_ADDED: "Added field '{p}' with type {n}",
+    ChangeType.FIELD_REMOVED: "Removed field '{p}' (was type {o})",
+    ChangeType.TYPE_CHANGED: "Changed field '{p}' type from {o} to {n}",
+}
+
+
+@dataclass(slots=True)
 class SchemaChange:
     """Represents a single schema change."""
     change_type: ChangeType
@@ -25,69 +119,309 @@ class SchemaChange:
     
     def __str__(self) -> str:
         """Human-readable representation of the change."""
-        if self.change_type == ChangeType.FIELD_ADDED:
-            return f"Added field '{self.field_path}' with type {self.new_value}"
-        elif self.change_type == ChangeType.FIELD_REMOVED:
-            return f"Removed field '{self.field_path}' (was type {self.old_value})"
-        elif self.change_type == ChangeType.TYPE_CHANGED:
-            return f"Changed field '{self.field_path}' type from {self.old_value} to {self.new_value}"
-        return f"{self.change_type.value}: {self.field_path}"
+        template = _CHANGE_FORMATS.get(self.change_type)
+        if template is None:
+            return f"{self.change_type.value}: {self.field_path}"
+        return template.format(p=self.field_path, o=self.old_value, n=self.new_value)
+
+
+# A change as compare_schemas records it, before it is needed as a
+# SchemaChange: (change_type, field_path, old_value, new_value)
+RawChange = Tuple[ChangeType, str, Optional[str], Optional[str]]
 
 
-@dataclass
 class SchemaDiff:
     """
     Represents the differences between two schemas.
-    Contains lists of added, removed, and modified fields.
+    Contains the added, removed, and modified fields.
+    
+    Changes are kept in a single list, added fields first, then removed,
+    then modified, with the counts of the first two marking where each
+    group ends. added_fields, removed_fields, modified_fields and
+    all_changes return new lists sliced from it, so callers may modify
+    them without affecting the diff or its counts.
+    
+    Diffs built by compare_schemas hold plain tuples and only turn them into
+    SchemaChange objects the first time a change list is read, so callers
+    that only check has_changes or print the summary never pay for them.
     """
-    added_fields: List[SchemaChange] = field(default_factory=list)
-    removed_fields: List[SchemaChange] = field(default_factory=list)
-    modified_fields: List[SchemaChange] = field(default_factory=list)
+    
+    __slots__ = ("_changes", "_added_count", "_removed_count", "_raw")
+    
+    def __init__(
+        self,
+        added_fields: Optional[List[SchemaChange]] = None,
+        removed_fields: Optional[List[SchemaChange]] = None,
+        modified_fields: Optional[List[SchemaChange]] = None
+    ):
+        """
+        Initialize the diff.
+        
+        Args:
+            added_fields: Changes for fields present only in the current schema
+            removed_fields: Changes for fields present only in the previous schema
+            modified_fields: Changes for fields whose type changed
+        """
+        added = added_fields or []
+        removed = removed_fields or []
+        self._changes: list = [*added, *removed, *(modified_fields or [])]
+        self._added_count = len(added)
+        self._removed_count = len(removed)
+        self._raw = False
+    
+    @classmethod
+    def _from_raw(
+        cls,
+        changes: List[RawChange],
+        added_count: int,
+        removed_count: int
+    ) -> "SchemaDiff":
+        """
+        Build a diff from raw change tuples, deferring SchemaChange creation.
+        
+        Args:
+            changes: Added, then removed, then modified changes
+            added_count: Number of added changes at the start of changes
+            removed_count: Number of removed changes following them
+        """
+        diff = cls.__new__(cls)
+        diff._changes = changes
+        diff._added_count = added_count
+        diff._removed_count = removed_count
+        diff._raw = True
+        return diff
+    
+    def _materialize(self) -> None:
+        """Replace raw change tuples with SchemaChange objects."""
+        if self._raw:
+            self._changes = [SchemaChange(*change) for change in self._changes]
+            self._raw = False
+    
+    @property
+    def added_fields(self) -> List[SchemaChange]:
+        """Changes for fields present only in the current schema."""
+        self._materialize()
+        return self._changes[:self._added_count]
+    
+    @property
+    def removed_fields(self) -> List[SchemaChange]:
+        """Changes for fields present only in the previous schema."""
+        self._materialize()
+        return self._changes[self._added_count:self._added_count + self._removed_count]
+    
+    @property
+    def modified_fields(self) -> List[SchemaChange]:
+        """Changes for fields whose type changed."""
+        self._materialize()
+        return self._changes[self._added_count + self._removed_count:]
     
     @property
     def has_changes(self) -> bool:
         """Check if there are any schema changes."""
-        return bool(self.added_fields or self.removed_fields or self.modified_fields)
+        return bool(self._changes)
     
     @property
     def all_changes(self) -> List[SchemaChange]:
         """Get all changes as a single list."""
-        return self.added_fields + self.removed_fields + self.modified_fields
+        self._materialize()
+        return self._changes[:]
+    
+    def __eq__(self, other: object) -> bool:
+        """Diffs are equal when they hold the same changes."""
+        if not isinstance(other, SchemaDiff):
+            return NotImplemented
+        return (
+            (self._added_count, self._removed_count, self.all_changes) ==
+            (other._added_count, other._removed_count, other.all_changes)
+        )
+    
+    def __repr__(self) -> str:
+        """Debug representation listing every change."""
+        return (
+            f"SchemaDiff(added_fields={self.added_fields!r}, "
+            f"removed_fields={self.removed_fields!r}, "
+            f"modified_fields={self.modified_fields!r})"
+        )
     
     def __str__(self) -> str:
         """Human-readable summary of schema differences."""
-        if not self.has_changes:
-            return "No schema changes detected"
+        added = self._added_count
+        removed = self._removed_count
+        modified = len(self._changes) - added - removed
+        
+        # Most comparisons find nothing; skip building the summary
+        if not (added or removed or modified):
+            return NO_CHANGES_SUMMARY
         
         parts = []
-        if self.added_fields:
-            parts.append(f"{len(self.added_fields)} field(s) added")
-        if self.removed_fields:
-            parts.append(f"{len(self.removed_fields)} field(s) removed")
-        if self.modified_fields:
-            parts.append(f"{len(self.modified_fields)} field(s) modified")
+        if added:
+            parts.append(f"{added} field(s) added")
+        if removed:
+            parts.append(f"{removed} field(s) removed")
+        if modified:
+            parts.append(f"{modified} field(s) modified")
         
         return ", ".join(parts)
 
 
+# Source of a check that a value has the given exact JSON type; {v} is the
+# expression for the value
+_TYPE_CHECKS: Dict[type, str] = {
+    type(None): "{v} is None",
+    bool: "type({v}) is bool",
+    int: "type({v}) is int",
+    float: "type({v}) is float",
+    str: "type({v}) is str",
+}
+
+
+def _shape_check_source(example: Dict[Any, Any]) -> Optional[str]:
+    """
+    Generate an extractor that checks a response against the example's shape.
+    
+    The generated extract(r0) checks, in straight-line code, that every
+    object has exactly the example's keys and every value the example's
+    exact type (lists only down to their first item, as _walk descends).
+    Any response passing the checks has the example's schema, so extract
+    returns a copy of _TEMPLATE without walking; anything else, including
+    missing keys, goes to _fallback.
+    
+    Returns:
+        Source defining extract, or None if the example has non-str keys or
+        values of types outside the exact JSON types
+    """
+    lines = [
+        "def extract(r0):",
+        "    try:",
+    ]
+    # (variable, expression it is bound to, object in the example)
+    objects = [("r0", None, example)]
+    names = count(1)
+    
+    while objects:
+        var, expr, obj = objects.pop()
+        if expr is not None:
+            lines.append(f"        {var} = {expr}")
+        
+        checks = [f"type({var}) is dict", f"len({var}) == {len(obj)}"]
+        for key, value in obj.items():
+            if type(key) is not str:
+                return None
+            item = f"{var}[{key!r}]"
+            value_type = type(value)
+            
+            if value_type is dict:
+                objects.append((f"r{next(names)}", item, value))
+            elif value_type is list:
+                if value and type(value[0]) is dict:
+                    checks.append(f"type({item}) is list and {item}")
+                    objects.append((f"r{next(names)}", f"{item}[0]", value[0]))
+                elif value and isinstance(value[0], dict):
+                    return None
+                else:
+                    checks.append(f"type({item}) is list and not ({item} and isinstance({item}[0], dict))")
+            elif value_type in _TYPE_CHECKS:
+                checks.append(_TYPE_CHECKS[value_type].format(v=item))
+            else:
+                return None
+        
+        lines.append(f"        if not ({' and '.join(checks)}):")
+        lines.append("            return _fallback(r0)")
+    
+    lines += [
+        "    except KeyError:",
+        "        return _fallback(r0)",
+        "    return _TEMPLATE.copy()",
+    ]
+    return "\n".join(lines)
+
+
+# (current, previous) schema structures to compare
+SchemaPair = Tuple[Dict[str, str], Dict[str, str]]
+
+
+def _compare_pair(pair: SchemaPair) -> "SchemaDiff":
+    """Compare one schema pair; module-level so worker processes can run it."""
+    return SchemaTracker(cache_size=0).compare_schemas(*pair)
+
+
 class SchemaTracker:
     """
     Tracks and compares API schema structures.
     Extracts schema from JSON responses and detects changes over time.
     """
     
-    def extract_schema_structure(self, response: Dict[Any, Any], path: str = "") -> Dict[str, str]:
+    # Default number of extracted schemas kept per tracker
+    CACHE_SIZE = 1024
+    
+    # Fewest changed pairs compare_many farms out to worker processes;
+    # smaller batches are compared in-process, where starting the pool
+    # would cost more than it saves
+    PARALLEL_MIN_PAIRS = 64
+    
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        """
+        Initialize the tracker with an empty schema cache.
+        
+        Args:
+            cache_size: Maximum number of extracted schemas to keep; the least
+                recently used entry is evicted once the cache is full
+        """
+        self.cache_size = cache_size
+        # Extracted schemas keyed by (path, digest of the raw JSON body),
+        # least recently used first. Digests keep entries small however
+        # large the bodies, and make lookups compare 16 bytes, not bodies
+        self._cache: "OrderedDict[Tuple[str, bytes], Dict[str, str]]" = OrderedDict()
+        # Extractors generated by specialize(), keyed by endpoint name
+        self._specialized: Dict[str, Callable[[Dict[Any, Any]], Dict[str, str]]] = {}
+    
+    def clear_cache(self) -> None:
+        """Discard all cached schema extractions and specialized extractors."""
+        self._cache.clear()
+        self._specialized.clear()
+    
+    def _cache_get(self, key: Tuple[str, bytes]) -> Optional[Dict[str, str]]:
+        """Look up a cached schema and mark it as most recently used."""
+        schema = self._cache.get(key)
+        if schema is not None:
+            self._cache.move_to_end(key)
+        return schema
+    
+    def _cache_put(self, key: Tuple[str, bytes], schema: Dict[str, str]) -> None:
+        """Cache a schema, evicting the least recently used entry if full."""
+        self._cache[key] = schema
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def extract_schema_structure(
+        self,
+        response: Union[Dict[Any, Any], bytes, str],
+        path: str = ""
+    ) -> Dict[str, str]:
         """
         Extract schema structure from a JSON response.
         Returns a flat dictionary mapping field paths to their types.
         
+        The response may also be the raw JSON body (e.g. from
+        PokeAPIClient._make_request_bytes). Schemas of raw bodies are cached
+        by a digest of the body, so the same payload extracted again (e.g.
+        compared against many historical schemas) is neither parsed nor
+        walked twice. The cache is a bounded LRU of cache_size entries, so
+        long runs over many distinct payloads don't grow it without limit.
+        Parsed responses are not cached, since building a content key would
+        cost more than the walk. Each call returns its own dictionary, so
+        callers may modify the result.
+        
         Args:
-            response: JSON response dictionary
-            path: Current path in the nested structure (used for recursion)
+            response: JSON response dictionary, or raw JSON bytes/str
+            path: Path prefix for the extracted fields (empty for the root)
             
         Returns:
             Dictionary mapping field paths to type names
             
+        Raises:
+            orjson.JSONDecodeError: If a raw response is not valid JSON
+            
         Example:
             Input: {"id": 1, "name": "bulbasaur", "types": [{"slot": 1}]}
             Output: {
@@ -97,98 +431,260 @@ class SchemaTracker:
                 "types[].slot": "int"
             }
         """
-        schema = {}
+        if isinstance(response, (bytes, str)):
+            raw = response.encode() if isinstance(response, str) else response
+            key = (path, blake2b(raw, digest_size=BODY_DIGEST_SIZE).digest())
+            schema = self._cache_get(key)
+            if schema is None:
+                parsed = orjson.loads(raw)
+                schema = self._walk(parsed, path) if isinstance(parsed, dict) else {}
+                self._cache_put(key, schema)
+            return dict(schema)
         
-        if response is None:
-            return schema
+        if not isinstance(response, dict):
+            return {}
         
-        if isinstance(response, dict):
-            for key, value in response.items():
-                field_path = f"{path}.{key}" if path else key
+        # Parsed responses are walked directly: a content key would mean
+        # serializing the whole payload, while the walk reads only the
+        # first item of each list
+        return self._walk(response, path)
+    
+    def specialize(
+        self,
+        endpoint_name: str,
+        example_response: Dict[Any, Any]
+    ) -> Callable[[Dict[Any, Any]], Dict[str, str]]:
+        """
+        Get an extractor specialized to the shape of an endpoint's responses.
+        
+        Responses from one endpoint almost always share a shape. The first
+        call for an endpoint generates and compiles a function that checks a
+        response against example_response in straight-line code and, if the
+        shape matches, returns a copy of the example's schema without
+        walking the response. Responses that differ in any
+        field or type fall through to extract_schema_structure, so the
+        result is always the same schema it would return (with fields in
+        the example's order). Later calls return the same extractor,
+        whatever example they pass.
+        
+        Args:
+            endpoint_name: Endpoint the extractor is for (e.g. 'pokemon')
+            example_response: A typical JSON response from the endpoint
+            
+        Returns:
+            Function mapping a JSON response to its schema structure
+        """
+        extractor = self._specialized.get(endpoint_name)
+        if extractor is None:
+            source = (
+                _shape_check_source(example_response)
+                if isinstance(example_response, dict) else None
+            )
+            if source is None:
+                extractor = self.extract_schema_structure
+            else:
+                namespace = {
+                    "_fallback": self.extract_schema_structure,
+                    "_TEMPLATE": self._walk(example_response, ""),
+                }
+                exec(compile(source, f"<schema extractor: {endpoint_name}>", "exec"), namespace)
+                extractor = namespace["extract"]
+            self._specialized[endpoint_name] = extractor
+        return extractor
+    
+    def _walk(self, response: Dict[Any, Any], path: str) -> Dict[str, str]:
+        """
+        Walk a JSON object and map each field path to its type name.
+        
+        Args:
+            response: JSON object to walk
+            path: Path prefix for the extracted fields
+            
+        Returns:
+            Dictionary mapping field paths to type names
+        """
+        schema: Dict[str, str] = {}
+        
+        # Walk with an explicit stack of (path prefix, cached child paths,
+        # items iterator) instead of recursing. Descending pauses the parent's
+        # iterator and resumes it once the child is exhausted, so fields come
+        # out in the same depth-first order as before, without a Python frame
+        # per nested node or a temporary dict merged into the result at every
+        # level.
+        stack = [(path, _child_paths(path), iter(response.items()))]
+        type_names = _TYPE_NAMES
+        
+        while stack:
+            prefix, paths, items = stack[-1]
+            
+            for key, value in items:
+                field_path = paths.get(key)
+                if field_path is None or type(key) is not str:
+                    field_path = _new_path(paths, prefix, key)
                 
-                if value is None:
-                    schema[field_path] = "null"
-                elif isinstance(value, bool):
-                    # Check bool before int since bool is subclass of int
-                    schema[field_path] = "bool"
-                elif isinstance(value, int):
-                    schema[field_path] = "int"
-                elif isinstance(value, float):
-                    schema[field_path] = "float"
-                elif isinstance(value, str):
-                    schema[field_path] = "str"
-                elif isinstance(value, list):
-                    schema[field_path] = "list"
-                    # Extract schema from first list item if available
-                    if value and len(value) > 0:
-                        list_item_schema = self.extract_schema_structure(
-                            value[0],
-                            f"{field_path}[]"
-                        )
-                        schema.update(list_item_schema)
-                elif isinstance(value, dict):
-                    schema[field_path] = "dict"
-                    # Recursively extract nested structure
-                    nested_schema = self.extract_schema_structure(value, field_path)
-                    schema.update(nested_schema)
-                else:
-                    schema[field_path] = type(value).__name__
+                # One dict lookup names the exact JSON types; only other
+                # types fall back to isinstance checks
+                type_name = type_names.get(type(value)) or _type_name(value)
+                schema[field_path] = type_name
+                
+                if type_name == "list":
+                    # Extract schema from first list item if it is an object
+                    if value and isinstance(value[0], dict):
+                        item_path = intern(f"{field_path}[]")
+                        stack.append((item_path, _child_paths(item_path), iter(value[0].items())))
+                        break
+                elif type_name == "dict":
+                    # Descend into the nested structure
+                    stack.append((field_path, _child_paths(field_path), iter(value.items())))
+                    break
+            else:
+                # Current level exhausted; resume the parent
+                stack.pop()
         
         return schema
     
+    def fingerprint(self, schema: Dict[str, str]) -> int:
+        """
+        Compute an order-independent fingerprint of a schema structure.
+        
+        The XOR of each (field path, type) pair's hash, so equal schemas get
+        equal fingerprints however their fields are ordered. Pass the
+        fingerprints to compare_schemas to skip the diff when a schema is
+        unchanged. String hashes are randomized per process, so fingerprints
+        must not be persisted or compared across processes.
+        
+        Args:
+            schema: Schema structure (from extract_schema_structure)
+            
+        Returns:
+            Fingerprint of the schema
+        """
+        fingerprint = 0
+        for item in schema.items():
+            fingerprint ^= hash(item)
+        return fingerprint
+    
     def compare_schemas(
         self,
         current: Dict[str, str],
-        previous: Dict[str, str]
+        previous: Dict[str, str],
+        current_fingerprint: Optional[int] = None,
+        previous_fingerprint: Optional[int] = None
     ) -> SchemaDiff:
         """
         Compare two schema structures and detect changes.
         
+        When both fingerprints are given and match (and the schemas have the
+        same number of fields), the schemas are taken to be equal without
+        diffing them. A hash collision could hide a change, so only pass
+        fingerprints where that risk is acceptable.
+        
         Args:
             current: Current schema structure (from extract_schema_structure)
             previous: Previous schema structure (from extract_schema_structure)
+            current_fingerprint: Optional fingerprint() of current
+            previous_fingerprint: Optional fingerprint() of previous
             
         Returns:
             SchemaDiff object containing all detected changes
         """
-        diff = SchemaDiff()
+        if (current_fingerprint is not None and
+                current_fingerprint == previous_fingerprint and
+                len(current) == len(previous)):
+            return SchemaDiff()
         
-        current_fields = set(current.keys())
-        previous_fields = set(previous.keys())
+        # Unchanged schemas are the common case; one C-level dict comparison
+        # (stopping at the first difference) settles it without building
+        # any change lists
+        if current is previous or current == previous:
+            return SchemaDiff()
         
+        # dict_keys views support set operations directly, so no copies of
+        # either schema's keys are made
+        current_fields = current.keys()
+        previous_fields = previous.keys()
+        previous_type = previous.get
+        
+        # Changes are recorded as raw tuples in one list, grouped as
+        # SchemaDiff expects; SchemaDiff creates the SchemaChange objects
+        # only if a change list is read.
         # Detect added fields
-        added = current_fields - previous_fields
-        for field_path in sorted(added):
-            change = SchemaChange(
-                change_type=ChangeType.FIELD_ADDED,
-                field_path=field_path,
-                new_value=current[field_path]
-            )
-            diff.added_fields.append(change)
+        changes: List[RawChange] = [
+            (ChangeType.FIELD_ADDED, field_path, None, current[field_path])
+            for field_path in sorted(current_fields - previous_fields)
+        ]
+        added_count = len(changes)
         
         # Detect removed fields
-        removed = previous_fields - current_fields
-        for field_path in sorted(removed):
-            change = SchemaChange(
-                change_type=ChangeType.FIELD_REMOVED,
-                field_path=field_path,
-                old_value=previous[field_path]
-            )
-            diff.removed_fields.append(change)
-        
-        # Detect modified fields (type changes)
-        common_fields = current_fields & previous_fields
-        for field_path in sorted(common_fields):
-            if current[field_path] != previous[field_path]:
-                change = SchemaChange(
-                    change_type=ChangeType.TYPE_CHANGED,
-                    field_path=field_path,
-                    old_value=previous[field_path],
-                    new_value=current[field_path]
-                )
-                diff.modified_fields.append(change)
+        changes.extend([
+            (ChangeType.FIELD_REMOVED, field_path, previous[field_path], None)
+            for field_path in sorted(previous_fields - current_fields)
+        ])
+        removed_count = len(changes) - added_count
         
-        return diff
+        # Detect modified fields (type changes); filter before sorting so
+        # only the changed paths are sorted, not every common field.
+        # previous.get(path, type) returns the current type for added
+        # paths, so one pass over current.items() finds type changes
+        # without building the set of common fields
+        changes.extend([
+            (ChangeType.TYPE_CHANGED, field_path, previous[field_path], current[field_path])
+            for field_path in sorted([
+                field_path for field_path, field_type in current.items()
+                if previous_type(field_path, field_type) != field_type
+            ])
+        ])
+        
+        return SchemaDiff._from_raw(changes, added_count, removed_count)
+    
+    @classmethod
+    def compare_many(
+        cls,
+        pairs: Sequence[SchemaPair],
+        workers: Optional[int] = None
+    ) -> List[SchemaDiff]:
+        """
+        Compare many (current, previous) schema pairs.
+        
+        Each diff is independent CPU-bound work, so large batches are spread
+        over a process pool, where every worker has its own GIL. Pairs that
+        are equal are answered in the calling process and never pickled.
+        Workers are started by a forkserver rather than forked, since the
+        caller (pytest, the async client) may have live threads whose locks
+        a forked child would inherit mid-acquire. Batches with fewer than PARALLEL_MIN_PAIRS remaining pairs, or
+        workers=1, are compared serially.
+        
+        Args:
+            pairs: (current, previous) schema structures to compare
+            workers: Worker processes to use (defaults to the CPU count)
+            
+        Returns:
+            One SchemaDiff per pair, in the order given
+        """
+        diffs: List[Optional[SchemaDiff]] = [None] * len(pairs)
+        pending: List[int] = []
+        for i, (current, previous) in enumerate(pairs):
+            if current == previous:
+                diffs[i] = SchemaDiff()
+            else:
+                pending.append(i)
+        
+        workers = workers or os.cpu_count() or 1
+        changed = [pairs[i] for i in pending]
+        if workers == 1 or len(changed) < cls.PARALLEL_MIN_PAIRS:
+            results = map(_compare_pair, changed)
+        else:
+            # Several chunks per worker keep them busy while amortizing IPC
+            chunksize = max(1, len(changed) // (workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+            ) as executor:
+                results = list(executor.map(_compare_pair, changed, chunksize=chunksize))
+        
+        for i, diff in zip(pending, results):
+            diffs[i] = diff
+        return diffs
     
     def get_field_paths(self, schema: Dict[str, str]) -> Set[str]:
         """